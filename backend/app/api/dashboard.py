@@ -1,59 +1,83 @@
-from fastapi import APIRouter, HTTPException
-from ..sessions import sessions
+from fastapi import APIRouter, HTTPException, Response
+from ..sessions import get_all_sessions, find_session, message_timestamp
 import datetime
+import logging
+import time
+import orjson
 from pydantic import BaseModel
 
-router = APIRouter(prefix="/api/admin", tags=["dashboard"])
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/api/admin",
+    tags=["dashboard"]
+)
+
+# Short-lived /stats snapshot shared by all pollers, kept already encoded
+STATS_TTL_SECONDS = 0.5
+_stats_cache = {"expires_at": 0.0, "body": b""}
 
 class ContextUpdate(BaseModel):
     session_id: str
     context: str
 
+def _invalidate_stats_cache():
+    _stats_cache["expires_at"] = 0.0
+
+def _json_response(body: bytes) -> Response:
+    # Returning a Response skips FastAPI's jsonable_encoder + json.dumps
+    # pass; payloads are encoded with orjson, datetimes included
+    return Response(content=body, media_type="application/json")
+
 @router.get("/stats")
-async def get_system_stats():
+async def get_system_stats() -> Response:
     """
     Returns global metrics across all active users/sessions.
+    Served from a snapshot at most STATS_TTL_SECONDS old.
     """
+    now = time.monotonic()
+    if now >= _stats_cache["expires_at"]:
+        _stats_cache["body"] = orjson.dumps(_build_system_stats())
+        _stats_cache["expires_at"] = now + STATS_TTL_SECONDS
+    return _json_response(_stats_cache["body"])
+
+def _build_system_stats() -> dict:
+    # Snapshot under the sessions lock, aggregate outside it
+    sessions = get_all_sessions()
     total_sessions = len(sessions)
-    active_now = len([s for s in sessions.values() if s.is_playing])
-    
-    all_ttfts = [
-        s.metrics["avg_ttft"] 
-        for s in sessions.values() 
-        if s.metrics.get("avg_ttft", 0) > 0
-    ]
-    avg_system_latency = sum(all_ttfts) / len(all_ttfts) if all_ttfts else 0
-    
-    total_tool_calls = sum([s.metrics.get("tool_calls_count", 0) for s in sessions.values()])
+    active_now = 0
+    ttft_sum = 0.0
+    ttft_count = 0
+    total_tool_calls = 0
     
     user_list = []
     for s in sessions.values():
-
-        last_u = ""
-        last_a = ""
-        if s.history:
-
-            user_msgs = [m["content"] for m in s.history if m.get("role") == "user"]
-            ai_msgs = [m["content"] for m in s.history if m.get("role") == "assistant"]
-            if user_msgs: 
-                last_u = user_msgs[-1][:100]  
-            if ai_msgs: 
-                last_a = ai_msgs[-1][:100]    
+        if s.is_playing:
+            active_now += 1
+        
+        ttft = s.avg_ttft
+        if ttft > 0:
+            ttft_sum += ttft
+            ttft_count += 1
         
+        total_tool_calls += s.metrics.get("tool_calls_count", 0)
+
         user_list.append({
             "id": str(s.session_id)[-6:],
             "full_id": str(s.session_id), 
             "user_id": str(s.user_id),
             "turns": int(s.metrics.get("total_turns", 0)),
-            "avg_ttft": round(float(s.metrics.get("avg_ttft", 0)), 3),
+            "avg_ttft": round(ttft, 3),
             "last_active": s.last_active.strftime("%H:%M:%S"),
             "is_playing": bool(s.is_playing),
-            "last_transcript": last_u,  
-            "last_response": last_a     
+            "last_transcript": s.last_user_preview,
+            "last_response": s.last_assistant_preview
         })
 
+    avg_system_latency = ttft_sum / ttft_count if ttft_count else 0
+
     return {
-        "timestamp": datetime.datetime.now().isoformat(),
+        "timestamp": datetime.datetime.now(),
         "sessions": {
             "total_created": total_sessions,
             "currently_speaking": active_now,
@@ -66,81 +90,71 @@ async def get_system_stats():
     }
 
 @router.post("/update-context")
-async def update_agent_context(data: ContextUpdate):
+async def update_agent_context(data: ContextUpdate) -> Response:
     """
     Allows the admin to change the system prompt of a live session.
     Matches against either the full UUID or the 6-character Short ID.
     """
-    target_session = None
-    
-    for sid, s in sessions.items():
-        if sid == data.session_id or sid.endswith(data.session_id):
-            target_session = s
-            break
+    target_session = find_session(data.session_id)
             
     if not target_session:
         raise HTTPException(status_code=404, detail="Session not found")
     target_session.system_prompt = data.context
+    _invalidate_stats_cache()
     
-    print(f"🛠️  [ADMIN] Context updated for session {target_session.session_id[:6]}")
-    return {
+    logger.info("🛠️  [ADMIN] Context updated for session %.6s", target_session.session_id)
+    return _json_response(orjson.dumps({
         "status": "success", 
         "message": f"Context updated for session {data.session_id}",
         "new_prompt": target_session.system_prompt
-    }
+    }))
 
 @router.get("/session/{session_id}/history")
-async def get_user_history(session_id: str):
+async def get_user_history(session_id: str) -> Response:
     """
     Retrieve conversation history for a specific session.
     Matches against either the full UUID or the 6-character short ID.
     """
-    target_session = None
-    
-    # Try to find session by full ID or short ID
-    for sid, s in sessions.items():
-        if sid == session_id or sid.endswith(session_id) or sid[-6:] == session_id:
-            target_session = s
-            break
+    target_session = find_session(session_id)
     
     if not target_session:
         raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
     
-    return {
+    return _json_response(orjson.dumps({
         "session_id": target_session.session_id,
         "user_id": target_session.user_id,
-        "created_at": target_session.created_at.isoformat(),
-        "last_active": target_session.last_active.isoformat(),
+        "created_at": target_session.created_at,
+        "last_active": target_session.last_active,
         "metrics": target_session.get_metrics(),
         "messages": [
             {
                 "role": msg.get("role", "unknown"),
                 "content": msg.get("content", ""),
-                "timestamp": msg.get("timestamp", "")
+                "timestamp": message_timestamp(msg)
             }
             for msg in target_session.history
         ]
-    }
+    }))
 
 @router.get("/sessions")
-async def list_all_sessions():
+async def list_all_sessions() -> Response:
     """
     Return all active sessions with their current status.
     """
     session_list = []
     
-    for session_id, session in sessions.items():
+    for session_id, session in get_all_sessions().items():
         session_list.append({
             "id": session_id[-6:],
             "full_id": session_id,
             "user_id": session.user_id,
             "status": "speaking" if session.is_playing else "idle",
             "turns": session.metrics.get("total_turns", 0),
-            "avg_ttft": round(session.metrics.get("avg_ttft", 0), 3),
-            "last_active": session.last_active.isoformat()
+            "avg_ttft": round(session.avg_ttft, 3),
+            "last_active": session.last_active
         })
     
-    return {
+    return _json_response(orjson.dumps({
         "total_sessions": len(session_list),
         "sessions": session_list
-    }
\ No newline at end of file
+    }))
\ No newline at end of file
@@ -8,8 +8,16 @@ class UtteranceCollector:
         silence_timeout: float = 1.2,
         min_utterance_sec: float = 0.2,
         early_trigger_sec: float = 0.15,
+        sample_rate: int = 16000,
+        initial_capacity_sec: float = 30.0,
     ):
-        self.buffer = []
+        # Preallocated buffer of the int16 PCM as received, plus write
+        # cursor; grows by doubling
+        self._cap = int(sample_rate * initial_capacity_sec)
+        self._buf = np.empty(self._cap, dtype=np.int16)
+        self._n = 0
+        self.sample_rate = sample_rate
+
         self.active = False
         self.last_speech_time = None
         self.start_time = None
@@ -26,11 +34,11 @@ class UtteranceCollector:
         if is_speech:
             if not self.active:
                 self.active = True
-                self.buffer = []
+                self._n = 0
                 self.start_time = now
                 self.partial_fired = False
 
-            self.buffer.append(samples)
+            self._append(samples)
             self.last_speech_time = now
 
             elapsed = now - self.start_time
@@ -50,15 +58,28 @@ class UtteranceCollector:
             silence_duration = now - self.last_speech_time
 
             if silence_duration >= self.silence_timeout:
-                utterance = np.concatenate(self.buffer, axis=0)
-                self.buffer = []
+                n = self._n
+                self._n = 0
                 self.active = False
                 self.last_speech_time = None
                 self.start_time = None
                 self.partial_fired = False
 
-                utterance_duration = len(utterance) / 16000.0
+                utterance_duration = n / self.sample_rate
                 if utterance_duration >= self.min_utterance_sec:
-                    return utterance
+                    # Copy out so the buffer can be reused for the next turn
+                    return self._buf[:n].copy()
+
+        return None
 
-        return None
\ No newline at end of file
+    def _append(self, samples: np.ndarray):
+        k = len(samples)
+        end = self._n + k
+        if end > self._cap:
+            while self._cap < end:
+                self._cap *= 2
+            grown = np.empty(self._cap, dtype=np.int16)
+            grown[:self._n] = self._buf[:self._n]
+            self._buf = grown
+        self._buf[self._n:end] = samples
+        self._n = end
@@ -1,4 +1,68 @@
+import math
 import numpy as np
+from numba import njit
+from scipy.signal import butter
+
+# Normalizes int16 PCM to [-1.0, 1.0)
+_INT16_SCALE = 1.0 / 32768.0
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _vad_step(
+    samples, sample_scale, sos, zi, band_scale,
+    ema, ema_alpha,
+    noise_floor, noise_alpha, threshold, min_threshold, threshold_multiplier,
+    in_speech, speech_frames, silence_frames, min_speech_frames, hangover_frames,
+):
+    """
+    One VAD frame, compiled: bandpass energy, smoothing, noise floor and
+    the speech/silence state machine. zi is updated in place.
+    Samples are multiplied by sample_scale as they are read, so int16 PCM
+    is normalized here without a separate float conversion pass.
+
+    Returns:
+        (in_speech, noise_floor, threshold, ema, speech_frames, silence_frames)
+    """
+    # Band-limited energy: cascaded biquads (transposed direct form II,
+    # same layout as scipy.signal.sosfilt) followed by RMS
+    n = samples.shape[0]
+    energy = 0.0
+    if n > 0 and band_scale > 0.0:
+        acc = 0.0
+        for i in range(n):
+            x = samples[i] * sample_scale
+            for k in range(sos.shape[0]):
+                y = sos[k, 0] * x + zi[k, 0]
+                zi[k, 0] = sos[k, 1] * x - sos[k, 4] * y + zi[k, 1]
+                zi[k, 1] = sos[k, 2] * x - sos[k, 5] * y
+                x = y
+            acc += x * x
+        energy = math.sqrt(acc / n) * band_scale
+
+    # Use smoothed energy for more stable detection
+    ema = ema_alpha * energy + (1.0 - ema_alpha) * ema
+
+    # Update noise floor only during silence
+    # This prevents speech from raising the noise floor
+    if not in_speech:
+        noise_floor = noise_alpha * noise_floor + (1.0 - noise_alpha) * energy
+        threshold = max(min_threshold, noise_floor * threshold_multiplier)
+
+    if ema > threshold:
+        # Transition to speech state after minimum frames
+        speech_frames += 1
+        silence_frames = 0
+        if speech_frames >= min_speech_frames:
+            in_speech = True
+    else:
+        # Transition to silence state after hangover period
+        silence_frames += 1
+        speech_frames = 0
+        if silence_frames >= hangover_frames:
+            in_speech = False
+
+    return in_speech, noise_floor, threshold, ema, speech_frames, silence_frames
+
 
 class VoiceActivityDetector:
     """
@@ -37,11 +101,26 @@ class VoiceActivityDetector:
         self.low_freq = low_freq
         self.high_freq = high_freq
 
+        # Speech-band filter, designed once and run with carried state
+        self._sos = butter(
+            4, [low_freq, high_freq], btype="band", fs=sample_rate, output="sos"
+        )
+        self._zi = np.zeros((self._sos.shape[0], 2))
+
+        # Band calibration, recomputed only when the frame length changes
+        self._cached_n = -1
+        self._band_scale = 0.0
+
         # Noise floor tracking
         self.noise_floor = 0.005  # Lower initial noise floor (was 0.008)
         self.noise_alpha = noise_alpha
         self.threshold_multiplier = threshold_multiplier
 
+        # Dynamic threshold, only changes when the noise floor does.
+        # Minimum threshold prevents false positives in very quiet environments
+        self.min_threshold = 0.008  # (was 0.01)
+        self._threshold = max(self.min_threshold, self.noise_floor * threshold_multiplier)
+
         # Speech detection state
         self.speech_frames = 0
         self.silence_frames = 0
@@ -50,116 +129,80 @@ class VoiceActivityDetector:
 
         self.in_speech = False
         
-        # Energy history for smoother detection
-        self.energy_history = []
-        self.history_size = 3  # Keep last 3 energy values
+        # Exponential moving average of energy for smoother detection
+        self._ema = 0.0
+        self._ema_alpha = 0.5  # Roughly matches a 3-frame moving average
 
     def is_speech(self, samples: np.ndarray) -> bool:
         """
         Detect if audio samples contain speech.
         
+        Args:
+            samples: int16 PCM, or float samples in [-1.0, 1.0)
+        
         Returns:
             True if speech is detected, False otherwise
         """
-        # Calculate band-limited energy
-        energy = self._band_limited_rms(samples)
-        
-        # Update energy history
-        self.energy_history.append(energy)
-        if len(self.energy_history) > self.history_size:
-            self.energy_history.pop(0)
-        
-        # Use smoothed energy for more stable detection
-        smoothed_energy = np.mean(self.energy_history) if self.energy_history else energy
-
-        # Update noise floor only during silence
-        # This prevents speech from raising the noise floor
-        if not self.in_speech:
-            self.noise_floor = (
-                self.noise_alpha * self.noise_floor
-                + (1 - self.noise_alpha) * energy
-            )
-
-        # Dynamic threshold based on noise floor
-        # Minimum threshold prevents false positives in very quiet environments
-        threshold = max(
-            0.008,  # Minimum threshold (was 0.01)
-            self.noise_floor * self.threshold_multiplier
-        )
-
-        # Detect if current energy is above threshold
-        loud = smoothed_energy > threshold
-
-        if loud:
-            # Increment speech frame counter
-            self.speech_frames += 1
-            self.silence_frames = 0
-
-            # Transition to speech state after minimum frames
-            if self.speech_frames >= self.min_speech_frames:
-                if not self.in_speech:
-                    # Log speech start for debugging
-                    # print(f"🎤 Speech started - Energy: {smoothed_energy:.4f}, Threshold: {threshold:.4f}")
-                    pass
-                self.in_speech = True
-
+        if samples.dtype == np.int16:
+            scale = _INT16_SCALE
         else:
-            # Increment silence frame counter
-            self.silence_frames += 1
-            self.speech_frames = 0
-
-            # Transition to silence state after hangover period
-            if self.silence_frames >= self.hangover_frames:
-                if self.in_speech:
-                    # Log speech end for debugging
-                    # print(f"🔇 Speech ended - Silence frames: {self.silence_frames}")
-                    pass
-                self.in_speech = False
-
+            samples = np.ascontiguousarray(samples, dtype=np.float32)
+            scale = 1.0
+        n = samples.shape[0]
+        if n != self._cached_n:
+            self._update_band_scale(n)
+
+        (
+            self.in_speech,
+            self.noise_floor,
+            self._threshold,
+            self._ema,
+            self.speech_frames,
+            self.silence_frames,
+        ) = _vad_step(
+            samples, scale, self._sos, self._zi, self._band_scale,
+            self._ema, self._ema_alpha,
+            self.noise_floor, self.noise_alpha, self._threshold,
+            self.min_threshold, self.threshold_multiplier,
+            self.in_speech, self.speech_frames, self.silence_frames,
+            self.min_speech_frames, self.hangover_frames,
+        )
         return self.in_speech
 
-    def _band_limited_rms(self, samples: np.ndarray) -> float:
+    def _update_band_scale(self, n: int):
         """
-        Calculate RMS energy in the speech frequency band.
+        Recompute the band energy calibration for a new frame length.
         
-        Uses FFT to isolate speech frequencies (100-3500 Hz) which:
+        The speech band (100-3500 Hz) is isolated with an IIR bandpass which:
         - Reduces sensitivity to low-frequency noise (rumble, AC hum)
         - Reduces sensitivity to high-frequency noise (hiss, keyboard)
         - Focuses on human voice characteristics
         
-        Args:
-            samples: Audio samples as numpy array
-            
-        Returns:
-            RMS energy in the speech band
+        Its time-domain RMS is scaled to the magnitude of the previous
+        FFT-bin RMS so existing thresholds hold.
         """
-        if len(samples) == 0:
-            return 0.0
-
-        # Compute FFT
-        fft = np.fft.rfft(samples)
-        freqs = np.fft.rfftfreq(len(samples), d=1.0 / self.sample_rate)
-
-        # Create frequency band mask
-        band_mask = (freqs >= self.low_freq) & (freqs <= self.high_freq)
-        band_fft = fft[band_mask]
-
-        if band_fft.size == 0:
-            return 0.0
-
-        # Calculate power and RMS
-        power = np.abs(band_fft) ** 2
-        rms = float(np.sqrt(np.mean(power)))
-        
-        return rms
+        self._band_scale = 0.0
+        self._cached_n = n
+        if n == 0:
+            return
+
+        # Number of rfft bins inside the band for this frame length
+        k0 = int(np.ceil(self.low_freq * n / self.sample_rate))
+        k1 = min(int(np.floor(self.high_freq * n / self.sample_rate)), n // 2) + 1
+        bins = k1 - k0
+        # Parseval: mean bin power == time-domain power * n^2 / (2 * bins)
+        if bins > 0:
+            self._band_scale = n / math.sqrt(2.0 * bins)
 
     def reset(self):
         """Reset VAD state (useful between sessions)"""
         self.noise_floor = 0.005
+        self._threshold = max(self.min_threshold, self.noise_floor * self.threshold_multiplier)
         self.speech_frames = 0
         self.silence_frames = 0
         self.in_speech = False
-        self.energy_history = []
+        self._ema = 0.0
+        self._zi = np.zeros((self._sos.shape[0], 2))
 
     def get_stats(self) -> dict:
         """Get current VAD statistics for debugging"""
@@ -168,5 +211,5 @@ class VoiceActivityDetector:
             "speech_frames": self.speech_frames,
             "silence_frames": self.silence_frames,
             "noise_floor": self.noise_floor,
-            "threshold": max(0.008, self.noise_floor * self.threshold_multiplier)
+            "threshold": self._threshold
         }
\ No newline at end of file
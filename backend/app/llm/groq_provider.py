@@ -1,25 +1,71 @@
 import os
+import asyncio
 import logging
-import json
+import orjson
 import re
-from typing import List, Dict, AsyncGenerator
+import httpx
+from typing import List, Dict, Optional, AsyncGenerator
 from dotenv import load_dotenv
-from groq import AsyncGroq
-from app.sessions import get_session
+from groq import AsyncGroq, APIError, BadRequestError
+from app.sessions import get_session, HISTORY_COMPACT_AT
 from .tools import search_web, TAVILY_TOOL_DEFINITION
 
 logger = logging.getLogger(__name__)
 load_dotenv()
 
+_SENTENCE_ENDINGS = frozenset(".!?")
+
+# Words released ahead of the first sentence boundary
+FIRST_CHUNK_MIN_WORDS = 4
+
+# Function-call syntax leaked into plain text, e.g. search_web{"query": ...}
+_CALL_PREFIX = re.compile(r'^\w+\{')
+_MALFORMED_CALL = re.compile(r'^\w+\{.*\}$')
+
+TOOL_USAGE_INSTRUCTIONS = (
+    "TOOL USAGE INSTRUCTIONS:\n"
+    "- You have access to a search_web tool for finding real-time information.\n"
+    "- Use the search_web tool when the user asks about:\n"
+    "  * Current news, events, or weather\n"
+    "  * Recent information that changes frequently\n"
+    "  * Any topic requiring up-to-date facts\n"
+    "- The tool will be invoked automatically - do NOT generate function syntax in text.\n"
+    "- If you decide to use a tool, the system will handle it.\n"
+    "- If the user asks something you can answer from your knowledge, just answer directly.\n"
+    "- Always provide a helpful response, with or without tool results."
+)
+
+def _is_tool_call_failure(e: Exception) -> bool:
+    """
+    True for a rejected request (HTTP 400) or a tool_use_failed error event
+    raised mid-stream. Matches on type and error code, never on str(e).
+    """
+    if isinstance(e, BadRequestError):
+        return True
+    if isinstance(e, APIError) and isinstance(e.body, dict):
+        return e.body.get("code") == "tool_use_failed"
+    return False
+
+
 class GroqLLM:
+    # One client (and connection pool) shared by every instance, so the
+    # startup warmup primes the same connections live sessions use
+    _shared_client: Optional[AsyncGroq] = None
+
     def __init__(self):
         self.api_key = os.getenv("GROQ_API_KEY")
         if not self.api_key:
             logger.error("GROQ_API_KEY is missing from environment.")
             raise ValueError("Missing Groq API Key")
         
-        self.client = AsyncGroq(api_key=self.api_key)
+        if GroqLLM._shared_client is None:
+            GroqLLM._shared_client = AsyncGroq(
+                api_key=self.api_key,
+                timeout=httpx.Timeout(30.0, connect=2.0)
+            )
+        self.client = GroqLLM._shared_client
         self.model = "llama-3.3-70b-versatile"
+        self.summary_model = "llama-3.1-8b-instant"
 
     async def warmup(self) -> bool:
         """
@@ -33,7 +79,7 @@ class GroqLLM:
                     {"role": "system", "content": "You are a helpful assistant."},
                     {"role": "user", "content": "Hi"}
                 ],
-                max_tokens=10,
+                max_tokens=1,
                 temperature=0.1
             )
             return True
@@ -55,90 +101,112 @@ class GroqLLM:
             yield "Session error."
             return
 
-        system_instruction = (
-            f"{session.system_prompt}\n\n"
-            "TOOL USAGE INSTRUCTIONS:\n"
-            "- You have access to a search_web tool for finding real-time information.\n"
-            "- Use the search_web tool when the user asks about:\n"
-            "  * Current news, events, or weather\n"
-            "  * Recent information that changes frequently\n"
-            "  * Any topic requiring up-to-date facts\n"
-            "- The tool will be invoked automatically - do NOT generate function syntax in text.\n"
-            "- If you decide to use a tool, the system will handle it.\n"
-            "- If the user asks something you can answer from your knowledge, just answer directly.\n"
-            "- Always provide a helpful response, with or without tool results."
+        # Rebuilt only when the prompt or dynamic context changed since the last turn
+        if session.cached_system_version != session.system_prompt_version:
+            session.cached_system_msg = {
+                "role": "system",
+                "content": f"{session.get_full_system_prompt()}\n\n{TOOL_USAGE_INSTRUCTIONS}"
+            }
+            session.cached_system_version = session.system_prompt_version
+
+        summary = (
+            [{"role": "system", "content": f"Summary of earlier conversation: {session.summary}"}]
+            if session.summary else []
         )
 
-        messages = [{"role": "system", "content": system_instruction}]
-        
-        # Sanitize history to only include 'role' and 'content' (Groq doesn't support metadata)
-        for msg in session.history[-10:]:
-            if isinstance(msg, dict) and "role" in msg and "content" in msg:
-                messages.append({
-                    "role": msg["role"],
-                    "content": msg["content"]
-                })
-        
-        messages.append({"role": "user", "content": text})
+        # Send all retained history rather than a sliding window: compaction
+        # keeps it bounded, and the prompt prefix then stays byte-identical
+        # between turns (only growing at the tail) so Groq can reuse it.
+        # Sanitize history to only include 'role' and 'content' (Groq doesn't support metadata).
+        # Built in one pass straight off the deque, with no intermediate copies.
+        messages = [
+            session.cached_system_msg,
+            *summary,
+            *(
+                {"role": msg["role"], "content": msg["content"]}
+                for msg in session.history
+                if "role" in msg and "content" in msg
+            ),
+            {"role": "user", "content": text},
+        ]
 
-        response_message = None
+        tool_calls: Dict[int, Dict] = {}
+        content = ""
+        pending: List[str] = []
+        yielded = False
         
         try:
-            initial_completion = await self.client.chat.completions.create(
+            initial_stream = await self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 tools=[TAVILY_TOOL_DEFINITION],
                 tool_choice="auto",
                 max_tokens=500,
-                temperature=0.3
+                temperature=0.3,
+                stream=True
             )
-            response_message = initial_completion.choices[0].message
-            logger.info(f"✅ Got initial response - Tool calls: {len(response_message.tool_calls) if response_message.tool_calls else 0}")
+            
+            async for sentence in self._stream_sentences(
+                self._stream_tokens(initial_stream, tool_calls)
+            ):
+                content += sentence + " "
+                # Hold output back while it still looks like leaked function syntax
+                if not yielded and _CALL_PREFIX.match(content):
+                    pending.append(sentence)
+                    continue
+                for s in pending:
+                    yield s
+                pending = []
+                yielded = True
+                yield sentence
+            
+            logger.info(f"✅ Got initial response - Tool calls: {len(tool_calls)}")
 
         except Exception as e:
-            if "tool_use_failed" in str(e) or "400" in str(e):
+            if not yielded and _is_tool_call_failure(e):
                 logger.warning(f"⚠️ Tool Call Syntax Error. Falling back to direct response.")
-                fallback_completion = await self.client.chat.completions.create(
+                tool_calls = {}
+                content = ""
+                pending = []
+                fallback_stream = await self.client.chat.completions.create(
                     model=self.model,
                     messages=messages,
                     max_tokens=500,
-                    temperature=0.7
+                    temperature=0.7,
+                    stream=True
                 )
-                response_message = fallback_completion.choices[0].message
+                async for sentence in self._stream_sentences(self._stream_tokens(fallback_stream)):
+                    content += sentence + " "
+                    yield sentence
             else:
                 logger.error(f"💥 Groq Unexpected Error: {e}")
                 yield "I'm sorry, I encountered a connection error."
                 return
 
-        if response_message.tool_calls:
-            yield "Let me check that for you..."
+        content = content.strip()
+
+        if tool_calls:
+            ordered_calls = [call for _, call in sorted(tool_calls.items())]
             
-            messages.append(response_message)
-            full_assistant_response = ""
+            # Start every search now so they run concurrently with each
+            # other and with TTS of the filler sentence below
+            tool_tasks = [asyncio.create_task(self._run_tool(call)) for call in ordered_calls]
+            try:
+                yield "Let me check that for you..."
+                tool_messages = await asyncio.gather(*tool_tasks)
+            finally:
+                for task in tool_tasks:
+                    task.cancel()
             
-            for tool_call in response_message.tool_calls:
-                if tool_call.function.name == "search_web":
-                    try:
-                        args = json.loads(tool_call.function.arguments)
-                        query = args.get('query', '')
-                        logger.info(f"🔍 [TOOL USE] Searching for: {query}")
-                        
-                        search_results = search_web(query)
-                        
-                        messages.append({
-                            "role": "tool",
-                            "tool_call_id": tool_call.id,
-                            "name": "search_web",
-                            "content": search_results
-                        })
-                    except Exception as tool_err:
-                        logger.error(f"Failed to execute search tool: {tool_err}")
-                        messages.append({
-                            "role": "tool",
-                            "tool_call_id": tool_call.id,
-                            "name": "search_web",
-                            "content": json.dumps({"results": [], "error": str(tool_err)})
-                        })
+            messages.append({
+                "role": "assistant",
+                "content": content or None,
+                "tool_calls": [
+                    {"id": call["id"], "type": "function", "function": {"name": call["name"], "arguments": call["arguments"]}}
+                    for call in ordered_calls
+                ]
+            })
+            messages.extend(m for m in tool_messages if m is not None)
 
             final_stream = await self.client.chat.completions.create(
                 model=self.model,
@@ -147,43 +215,173 @@ class GroqLLM:
                 temperature=0.7
             )
             
-            async for sentence in self._stream_sentences(final_stream):
-                full_assistant_response += sentence + " "
+            async for sentence in self._stream_sentences(self._stream_tokens(final_stream)):
                 yield sentence
 
-            session.history.append({"role": "user", "content": text})
-            session.history.append({"role": "assistant", "content": full_assistant_response.strip()})
-
-        elif response_message.content:
-            content = response_message.content.strip()
-            
-            if content and not re.match(r'^\w+\{.*\}$', content):
-                sentences = re.split(r'(?<=[.!?])\s+', content)
-                for s in sentences:
-                    if s.strip():
-                        yield s.strip()
-            else:
+        elif content:
+            # pending is only non-empty once _CALL_PREFIX matched; the
+            # endswith test then rules out most text before the full regex
+            if pending and content.endswith("}") and _MALFORMED_CALL.match(content):
                 logger.warning(f"Filtered malformed function call output: {content}")
                 yield "I'm processing that request. Could you please repeat your question?"
+            else:
+                for s in pending:
+                    yield s
+
+        # The turn is added to history by the caller (ws.process_turn),
+        # which stores it with timestamps
+        self._schedule_compaction(session)
 
-            session.history.append({"role": "user", "content": text})
-            session.history.append({"role": "assistant", "content": response_message.content})
+    def _schedule_compaction(self, session):
+        """Fold old history into the session summary off the response path."""
+        task = session.compaction_task
+        if task and not task.done():
+            return
+        if len(session.history) > HISTORY_COMPACT_AT:
+            session.compaction_task = asyncio.create_task(self._compact_history(session))
 
-    async def _stream_sentences(self, stream):
+    async def _compact_history(self, session):
+        """
+        Summarizes messages older than the verbatim tail into session.summary.
+        The previous summary is extended, so old turns are never re-read.
+        """
+        # Messages stay in history until their summary is stored, so a
+        # failed or discarded summary loses nothing and turns started in
+        # the meantime still see them
+        generation = session.history_generation
+        old_messages = session.compactable()
+        if not old_messages:
+            return
+        
+        transcript = "\n".join(
+            f"{m.get('role', 'unknown')}: {m.get('content', '')}" for m in old_messages
+        )
+        try:
+            completion = await self.client.chat.completions.create(
+                model=self.summary_model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": (
+                            "Update the running summary of a voice conversation. "
+                            "Keep names, facts, preferences and open questions. "
+                            "Reply with the summary only, under 120 words."
+                        )
+                    },
+                    {
+                        "role": "user",
+                        "content": f"Current summary:\n{session.summary or '(none)'}\n\nNew messages:\n{transcript}"
+                    }
+                ],
+                max_tokens=200,
+                temperature=0.2
+            )
+            if session.history_generation != generation:
+                # History was cleared while the summary was being written
+                return
+            session.summary = (completion.choices[0].message.content or "").strip()
+            session.drop_compacted(old_messages)
+            logger.info(f"🗜️  [HISTORY COMPACTED] {session.session_id[-6:]} - {len(old_messages)} messages")
+        except Exception as e:
+            logger.warning(f"History compaction failed: {e}")
+
+    async def _run_tool(self, tool_call: Dict) -> Optional[Dict]:
+        """
+        Executes one streamed tool call and returns its tool message.
+        The blocking search runs in a worker thread.
+        """
+        if tool_call["name"] != "search_web":
+            return None
+        
+        try:
+            args = orjson.loads(tool_call["arguments"])
+            query = args.get('query', '')
+            logger.info(f"🔍 [TOOL USE] Searching for: {query}")
+            
+            search_results = await asyncio.to_thread(search_web, query)
+        except Exception as tool_err:
+            logger.error(f"Failed to execute search tool: {tool_err}")
+            search_results = orjson.dumps({"results": [], "error": str(tool_err)}).decode()
+        
+        return {
+            "role": "tool",
+            "tool_call_id": tool_call["id"],
+            "name": "search_web",
+            "content": search_results
+        }
+
+    async def _stream_tokens(self, stream, tool_calls: Optional[Dict[int, Dict]] = None):
+        """
+        Yields content tokens from a completion stream, accumulating any
+        streamed tool call fragments into tool_calls (keyed by call index).
+        """
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            
+            if delta.tool_calls and tool_calls is not None:
+                for tc in delta.tool_calls:
+                    call = tool_calls.setdefault(tc.index, {"id": "", "name": "", "arguments": ""})
+                    if tc.id:
+                        call["id"] = tc.id
+                    if tc.function:
+                        if tc.function.name:
+                            call["name"] += tc.function.name
+                        if tc.function.arguments:
+                            call["arguments"] += tc.function.arguments
+            
+            if delta.content:
+                yield delta.content
+
+    async def _stream_sentences(self, tokens):
         """
         Buffers tokens to yield complete sentences for smooth TTS.
+        
+        A sentence ends at a newline, or at '.', '!' or '?' followed by
+        whitespace. Only characters not yet examined are scanned per token.
+        
+        To start TTS sooner, the first chunk is released early: at the first
+        comma, or once it holds FIRST_CHUNK_MIN_WORDS complete words.
         """
         buffer = ""
-        async for chunk in stream:
-            token = chunk.choices[0].delta.content or ""
+        scan_from = 0
+        first_chunk = True
+        async for token in tokens:
             buffer += token
-
-            if re.search(r'[.!?](\s|$)', buffer) or '\n' in buffer:
-                parts = re.split(r'([.!?]\s|(?<=[.!?])\n|\n)', buffer, maxsplit=1)
-                if len(parts) > 1:
-                    sentence = parts[0] + parts[1]
-                    yield sentence.strip()
-                    buffer = parts[2] if len(parts) > 2 else ""
+            
+            i = scan_from
+            n = len(buffer)
+            while i < n:
+                c = buffer[i]
+                if c == "\n":
+                    end = i + 1
+                elif c in _SENTENCE_ENDINGS and i + 1 < n and buffer[i + 1].isspace():
+                    end = i + 2
+                elif first_chunk and c == "," and i + 1 < n and buffer[i + 1].isspace():
+                    end = i + 2
+                else:
+                    i += 1
+                    continue
+                
+                sentence = buffer[:end].strip()
+                if sentence:
+                    yield sentence
+                    first_chunk = False
+                buffer = buffer[end:]
+                i = 0
+                n = len(buffer)
+            
+            if first_chunk:
+                cut = buffer.rfind(" ")
+                if cut > 0 and len(buffer[:cut].split()) >= FIRST_CHUNK_MIN_WORDS:
+                    yield buffer[:cut].strip()
+                    first_chunk = False
+                    buffer = buffer[cut:]
+                    n = len(buffer)
+            
+            # A trailing terminator still needs to see the next character
+            scan_from = max(n - 1, 0)
         
         if buffer.strip():
-            yield buffer.strip()
\ No newline at end of file
+            yield buffer.strip()
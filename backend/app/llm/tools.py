@@ -1,5 +1,5 @@
 import os
-import json
+import orjson
 import logging
 from pathlib import Path
 from dotenv import load_dotenv
@@ -18,6 +18,9 @@ if not TAVILY_API_KEY:
 else:
     logger.info(f"✅ Tavily Key loaded successfully")
 
+# Created once so every search reuses the same keep-alive HTTP session
+tavily_client = TavilyClient(api_key=TAVILY_API_KEY) if TAVILY_API_KEY else None
+
 
 TAVILY_TOOL_DEFINITION = {
     "type": "function",
@@ -36,19 +39,17 @@ TAVILY_TOOL_DEFINITION = {
 
 def search_web(query: str) -> str:
     """Search the web using Tavily API and return formatted results."""
-    if not TAVILY_API_KEY:
+    if not tavily_client:
         logger.warning(f"Search requested but TAVILY_API_KEY not configured. Query: {query}")
-        return json.dumps({
+        return orjson.dumps({
             "results": [],
             "error": "Web search not configured. Please set TAVILY_API_KEY in .env file.",
             "suggestion": "Get a free API key from https://tavily.com"
-        })
+        }).decode()
     
     try:
         logger.info(f"🔍 Searching Tavily for: {query}")
-        client = TavilyClient(api_key=TAVILY_API_KEY)
-        
-        response = client.search(
+        response = tavily_client.search(
             query=query,
             search_depth="advanced",
             max_results=5
@@ -64,14 +65,15 @@ def search_web(query: str) -> str:
                 })
             
             logger.info(f"✅ Got {len(formatted_results)} search results")
-            return json.dumps({
+            # orjson writes non-ASCII as raw UTF-8 rather than \u escapes
+            return orjson.dumps({
                 "results": formatted_results,
                 "answer": response.get("answer"),
                 "follow_up_questions": response.get("follow_up_questions")
-            })
+            }).decode()
         else:
-            return json.dumps({"results": [], "error": "No results found"})
+            return orjson.dumps({"results": [], "error": "No results found"}).decode()
             
     except Exception as e:
         logger.error(f"❌ Search failed: {str(e)}")
-        return json.dumps({"results": [], "error": f"Search failed: {str(e)}"})
\ No newline at end of file
+        return orjson.dumps({"results": [], "error": f"Search failed: {str(e)}"}).decode()
\ No newline at end of file
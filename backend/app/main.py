@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from fastapi import FastAPI, WebSocket, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -29,52 +30,110 @@ app.add_middleware(
 # Include dashboard router
 app.include_router(dashboard_router)
 
-@app.on_event("startup")
-async def startup_event():
-    """Warm up all services on startup for better first-request performance"""
-    logger.info("🚀 Starting up voice agent...")
+def _compile_vad():
+    import numpy as np
+    from app.audio.vad import VoiceActivityDetector
 
-    # Warm up LLM
-    try:
-        from app.llm.groq_provider import GroqLLM
-        llm = GroqLLM()
-        
-        # Use the new warmup method instead of get_response_stream
-        success = await llm.warmup()
-        if success:
-            logger.info("✅ Groq LLM warmed")
-        else:
-            logger.warning("⚠️  LLM warmup failed")
-    except Exception as e:
-        logger.warning(f"⚠️  LLM warmup failed: {e}")
+    VoiceActivityDetector().is_speech(np.frombuffer(bytes(256), dtype=np.int16))
 
-    # Warm up STT
-    try:
-        from app.stt.deepgram_stream import DeepgramStreamingSTT
 
-        async def _noop(_): 
-            pass
+async def _warm_vad():
+    # Compiles the numba kernel for int16 frames or loads it from cache;
+    # a cold compile takes most of a second, so it runs off the event loop
+    await asyncio.to_thread(_compile_vad)
+
+
+async def _warm_llm():
+    from app.llm.groq_provider import GroqLLM
+
+    if not await GroqLLM().warmup():
+        raise RuntimeError("warmup request failed")
+
+
+async def _warm_stt():
+    # Opens the pooled streams that the first audio sessions will lease
+    from app.stt.deepgram_stream import stt_pool
+
+    await stt_pool.fill()
+
+
+async def _warm_tts():
+    from app.tts.deepgram_tts import DeepgramTTS
+
+    if not await DeepgramTTS().generate_audio("Hello"):
+        raise RuntimeError("no audio returned")
+
+
+async def cleanup_loop():
+    """Periodically remove inactive sessions"""
+    from app.sessions import cleanup_inactive_sessions
+
+    while True:
+        await asyncio.sleep(300)
+        try:
+            removed = cleanup_inactive_sessions(max_idle_seconds=3600)
+            if removed > 0:
+                logger.info(f"🧹 Cleaned up {removed} inactive sessions")
+        except Exception as e:
+            logger.error(f"Error in cleanup task: {e}")
+
+
+# Seconds startup waits on the LLM warmup before serving anyway
+LLM_WARMUP_TIMEOUT = 3.0
+
+# Per-service readiness, reported by /health
+app.state.ready = {"vad": False, "llm": False, "stt": False, "tts": False}
 
-        stt = DeepgramStreamingSTT(on_transcript=_noop)
-        await stt.connect()
-        await stt.disconnect()
 
-        logger.info("✅ Deepgram STT warmed")
+async def _run_warmup(key: str, name: str, warm):
+    """Run one warmup, log the outcome and record readiness."""
+    try:
+        await warm()
     except Exception as e:
-        logger.warning(f"⚠️  STT warmup failed: {e}")
+        logger.warning(f"⚠️  {name} warmup failed: {e}")
+        return
+    app.state.ready[key] = True
+    logger.info(f"✅ {name} warmed")
+
+
+@app.on_event("startup")
+async def startup_event():
+    """
+    Warm up services and start the session cleanup task.
+    Only the LLM warmup (bounded by LLM_WARMUP_TIMEOUT) holds up startup;
+    VAD, STT and TTS warm in the background while the app begins serving.
+    """
+    logger.info("🚀 Starting up voice agent...")
+
+    app.state.warmup_tasks = [
+        asyncio.create_task(_run_warmup("vad", "VAD", _warm_vad)),
+        asyncio.create_task(_run_warmup("stt", "Deepgram STT", _warm_stt)),
+        asyncio.create_task(_run_warmup("tts", "Deepgram TTS", _warm_tts)),
+    ]
 
-    # Warm up TTS
     try:
-        from app.tts.deepgram_tts import DeepgramTTS
+        await asyncio.wait_for(_run_warmup("llm", "Groq LLM", _warm_llm), timeout=LLM_WARMUP_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning(f"⚠️  Groq LLM warmup timed out after {LLM_WARMUP_TIMEOUT}s")
 
-        tts = DeepgramTTS()
-        await tts.generate_audio("Hello")
+    logger.info("🔥 Startup complete, background warmups continuing")
 
-        logger.info("✅ Deepgram TTS warmed")
-    except Exception as e:
-        logger.warning(f"⚠️  TTS warmup failed: {e}")
+    asyncio.create_task(cleanup_loop())
+    logger.info("🧹 Started session cleanup task")
 
-    logger.info("🔥 Startup warmup complete")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared Deepgram connection pools"""
+    from app.stt.deepgram_provider import DeepgramSTT
+    from app.stt.deepgram_stream import stt_pool
+    from app.tts.deepgram_tts import DeepgramTTS
+
+    await asyncio.gather(
+        DeepgramSTT.close_shared_client(),
+        DeepgramTTS.close_shared_client(),
+        stt_pool.close(),
+    )
 
 
 # ---------------------------------------------------------
@@ -91,10 +150,11 @@ class ContextUpdate(BaseModel):
 # ---------------------------------------------------------
 @app.get('/health')
 def health():
-    """Health check endpoint"""
+    """Health check endpoint, with per-service warmup readiness"""
     return {
         "status": "healthy",
-        "service": "voice-assistant-backend"
+        "service": "voice-assistant-backend",
+        "ready": app.state.ready
     }
 
 
@@ -149,11 +209,10 @@ async def update_voice_context(session_id: str, data: ContextUpdate):
         raise HTTPException(status_code=500, detail="Failed to update context")
     
     # Optionally cancel active task to apply new context immediately
-    if session_id in active_tasks:
-        task = active_tasks[session_id]
-        if not task.done():
-            task.cancel()
-            logger.info(f"⚡ [{session_id[-6:]}] Interrupted active response to apply new context.")
+    task = active_tasks.get(session_id)
+    if task and not task.done():
+        task.cancel()
+        logger.info(f"⚡ [{session_id[-6:]}] Interrupted active response to apply new context.")
     
     logger.info(f"✅ [{session_id[-6:]}] Context successfully updated.")
     
@@ -161,7 +220,7 @@ async def update_voice_context(session_id: str, data: ContextUpdate):
         "status": "success",
         "session_id": session_id,
         "context_replaced": data.replace,
-        "new_context": session.get_full_system_prompt() if hasattr(session, 'get_full_system_prompt') else session.system_prompt
+        "new_context": session.get_full_system_prompt()
     }
 
 
@@ -170,17 +229,13 @@ async def delete_session(session_id: str):
     """Delete a session and cleanup resources"""
     from app.sessions import remove_session
     
-    session = get_session(session_id)
-    if not session:
+    if not remove_session(session_id):
         raise HTTPException(status_code=404, detail="Session not found")
     
     # Cancel any active tasks
-    if session_id in active_tasks:
-        task = active_tasks[session_id]
-        if not task.done():
-            task.cancel()
-    
-    remove_session(session_id)
+    task = active_tasks.get(session_id)
+    if task and not task.done():
+        task.cancel()
     
     return {
         "status": "success",
@@ -239,22 +294,3 @@ async def websocket_audio_endpoint(ws: WebSocket):
     """
     await audio_ws(ws)
 
-
-@app.on_event("startup")
-async def start_cleanup_task():
-    """Start background task to cleanup inactive sessions"""
-    import asyncio
-    from app.sessions import cleanup_inactive_sessions
-    
-    async def cleanup_loop():
-        while True:
-            await asyncio.sleep(300)  
-            try:
-                removed = cleanup_inactive_sessions(max_idle_seconds=3600)
-                if removed > 0:
-                    logger.info(f"🧹 Cleaned up {removed} inactive sessions")
-            except Exception as e:
-                logger.error(f"Error in cleanup task: {e}")
-    
-    asyncio.create_task(cleanup_loop())
-    logger.info("🧹 Started session cleanup task")
\ No newline at end of file
@@ -1,30 +1,84 @@
+import os
 import uuid
+import time
 import datetime
 import logging
 import threading
-from typing import Dict, List, Optional
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Deque, Dict, Iterator, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Messages retained per session; older ones are evicted on append
+MAX_HISTORY = int(os.getenv("MAX_HISTORY", "20"))
+# Once history grows past HISTORY_COMPACT_AT, everything but the last
+# HISTORY_KEEP_RECENT messages is folded into the rolling summary. Both
+# scale with MAX_HISTORY (14 and 10 at the default of 20) so compaction
+# always runs before the deque starts dropping messages unsummarized.
+HISTORY_KEEP_RECENT = MAX_HISTORY // 2
+HISTORY_COMPACT_AT = max(MAX_HISTORY * 7 // 10, HISTORY_KEEP_RECENT + 1)
+if not 0 < HISTORY_KEEP_RECENT < HISTORY_COMPACT_AT < MAX_HISTORY:
+    raise ValueError(f"MAX_HISTORY={MAX_HISTORY} is too small to compact history (minimum 3)")
+
+# Live sessions kept at most; creating one past this evicts the least recently
+# active idle session, or is refused if every session is connected or playing
+MAX_SESSIONS = int(os.getenv("MAX_SESSIONS", "1000"))
+
+# Per-stage latencies update_metrics accepts as keyword arguments
+LATENCY_KEYS = frozenset({
+    "vad_latency", "stt_latency", "llm_latency", "tts_latency", "e2e_latency"
+})
+
 class VoiceSession:
+    __slots__ = (
+        "session_id", "user_id", "created_at", "created_at_mono", "last_active_mono", "_wall_offset",
+        "history", "history_generation", "last_user_preview", "last_assistant_preview", "summary",
+        "compaction_task", "_system_prompt", "system_prompt_version",
+        "cached_system_msg", "cached_system_version",
+        "_dynamic_context", "_full_prompt_cache", "is_playing", "connected", "live_caption",
+        "metrics", "_ttft_sum", "_ttft_n",
+    )
+
     def __init__(self, session_id: str, user_id: str = "guest"):
         self.session_id = session_id
         self.user_id = user_id
         self.created_at = datetime.datetime.now()
-        self.last_active = datetime.datetime.now()
+        # Activity is tracked on the monotonic clock; wall time is derived on read
+        self.created_at_mono = self.last_active_mono = time.monotonic()
+        self._wall_offset = self.created_at.timestamp() - self.last_active_mono
         
-        self.history: List[Dict] = []
-        self.system_prompt: str = (
+        self.history: Deque[Dict] = deque(maxlen=MAX_HISTORY)
+        # Bumped by clear_history so an in-flight compaction can tell its
+        # summary belongs to a conversation that no longer exists
+        self.history_generation = 0
+        # Latest message previews, maintained on write for the dashboard
+        self.last_user_preview: str = ""
+        self.last_assistant_preview: str = ""
+        # Rolling summary of messages compacted out of history
+        self.summary: str = ""
+        self.compaction_task = None
+        # Bumped on every system_prompt / dynamic_context write; the LLM
+        # provider caches its system message against it instead of
+        # rebuilding it per turn
+        self.system_prompt_version = 0
+        self.cached_system_msg: Optional[Dict] = None
+        self.cached_system_version = -1
+        self._full_prompt_cache: Optional[str] = None
+        self._dynamic_context = ""
+        self.system_prompt = (
             "You are a helpful voice assistant. Use search tools for current events. "
             "Never list long strings of numbers unless asked."
         )
         
-        self.dynamic_context: str = ""
-        
         self.is_playing: bool = False
+        # An audio socket is attached; connected sessions are never evicted
+        # by the session limit or the idle cleanup
+        self.connected: bool = False
+        # Agent caption of the current turn, resent whole on a client resync
+        self.live_caption: str = ""
         self.metrics = {
             "total_turns": 0,
-            "avg_ttft": 0.0,
             "tool_calls_count": 0,
             "last_latency": 0.0,
             "interruptions": 0,
@@ -34,30 +88,87 @@ class VoiceSession:
             "tts_latency": 0.0,
             "e2e_latency": 0.0
         }
+        # TTFT running totals; the average is derived on read
+        self._ttft_sum = 0.0
+        self._ttft_n = 0
 
     def update_metrics(self, ttft: float = None, tool_used: bool = False, **kwargs):
         """Update session metrics for tracking performance."""
         if ttft is not None:
             self.metrics["total_turns"] += 1
-            prev_avg = self.metrics["avg_ttft"]
-            n = self.metrics["total_turns"]
-            self.metrics["avg_ttft"] = ((prev_avg * (n - 1)) + ttft) / n
+            self._ttft_sum += ttft
+            self._ttft_n += 1
             self.metrics["last_latency"] = ttft
         
         if tool_used:
             self.metrics["tool_calls_count"] += 1
         
         for key, value in kwargs.items():
-            if key in self.metrics and value is not None:
+            if key in LATENCY_KEYS and value is not None:
                 self.metrics[key] = value
         
-        self.last_active = datetime.datetime.now()
+        self.last_active_mono = time.monotonic()
+
+    @property
+    def avg_ttft(self) -> float:
+        """Mean time-to-first-token over all recorded turns."""
+        return self._ttft_sum / self._ttft_n if self._ttft_n else 0.0
+
+    @property
+    def system_prompt(self) -> str:
+        return self._system_prompt
+
+    @system_prompt.setter
+    def system_prompt(self, value: str):
+        self._system_prompt = value
+        self._full_prompt_cache = None
+        self.system_prompt_version += 1
+
+    @property
+    def dynamic_context(self) -> str:
+        return self._dynamic_context
+
+    @dynamic_context.setter
+    def dynamic_context(self, value: str):
+        self._dynamic_context = value
+        self._full_prompt_cache = None
+        self.system_prompt_version += 1
+
+    @property
+    def last_active(self) -> datetime.datetime:
+        """Wall-clock time of the last activity, computed on demand."""
+        return datetime.datetime.fromtimestamp(self._wall_offset + self.last_active_mono)
+
+    def append_message(self, message: Dict):
+        """Append a message to history and refresh the role preview."""
+        self.history.append(message)
+        role = message.get("role")
+        if role == "user":
+            self.last_user_preview = message.get("content", "")[:100]
+        elif role == "assistant":
+            self.last_assistant_preview = message.get("content", "")[:100]
+
+    def compactable(self) -> List[Dict]:
+        """Messages older than the verbatim tail, if due; left in history."""
+        if len(self.history) <= HISTORY_COMPACT_AT:
+            return []
+        return list(islice(self.history, len(self.history) - HISTORY_KEEP_RECENT))
+
+    def drop_compacted(self, messages: List[Dict]):
+        """
+        Remove messages from compactable() once their summary is stored.
+        Any the deque has evicted since the snapshot are skipped.
+        """
+        history = self.history
+        for message in messages:
+            if history and history[0] is message:
+                history.popleft()
 
     def get_metrics(self) -> Dict:
         """Retrieve session metrics as JSON-serializable dict."""
         return {
             "total_turns": self.metrics["total_turns"],
-            "avg_ttft": round(self.metrics["avg_ttft"], 3),
+            "avg_ttft": round(self.avg_ttft, 3),
             "tool_calls_count": self.metrics["tool_calls_count"],
             "last_latency": round(self.metrics["last_latency"], 3),
             "interruptions": self.metrics["interruptions"],
@@ -69,45 +180,149 @@ class VoiceSession:
         }
     
     def get_full_system_prompt(self) -> str:
-        """Get system prompt with dynamic context appended."""
-        if self.dynamic_context:
-            return f"{self.system_prompt}\n\nAdditional Context:\n{self.dynamic_context}"
-        return self.system_prompt
+        """Get system prompt with dynamic context appended (built once per change)."""
+        if self._full_prompt_cache is None:
+            if self._dynamic_context:
+                self._full_prompt_cache = (
+                    f"{self._system_prompt}\n\nAdditional Context:\n{self._dynamic_context}"
+                )
+            else:
+                self._full_prompt_cache = self._system_prompt
+        return self._full_prompt_cache
 
-sessions: Dict[str, VoiceSession] = {}
+# Kept in least-recently-active order (see _touch), so cleanup can evict
+# from the front and stop at the first session that is still fresh
+sessions: "OrderedDict[str, VoiceSession]" = OrderedDict()
 _sessions_lock = threading.Lock()
 
-def create_session(user_id: str = "guest") -> str:
-    """Create a new session or return existing one for user."""
+def _touch(session: VoiceSession):
+    """Mark a session active and move it to the back. Call under _sessions_lock."""
+    session.last_active_mono = time.monotonic()
+    sessions.move_to_end(session.session_id)
+
+# 6-char short id -> full session ids sharing that suffix (admin lookups)
+short_index: Dict[str, List[str]] = {}
+
+def _index_add(session_id: str):
+    short_index.setdefault(session_id[-6:], []).append(session_id)
+
+def _index_remove(session_id: str):
+    short_key = session_id[-6:]
+    bucket = short_index.get(short_key)
+    if bucket and session_id in bucket:
+        bucket.remove(session_id)
+        if not bucket:
+            del short_index[short_key]
+
+# user id -> its live session, so reconnects resume instead of re-creating.
+# Anonymous "guest" connections are never shared.
+user_index: Dict[str, str] = {}
+ANONYMOUS_USER = "guest"
+
+def _forget_user(session: VoiceSession):
+    if user_index.get(session.user_id) == session.session_id:
+        del user_index[session.user_id]
+
+def _drop(session_id: str) -> VoiceSession:
+    """Pop a session and unindex it. Call under _sessions_lock."""
+    session = sessions.pop(session_id)
+    _forget_user(session)
+    _index_remove(session_id)
+    return session
+
+def _is_live(session: VoiceSession) -> bool:
+    """An audio socket is attached or audio is playing; never evicted."""
+    return session.connected or session.is_playing
+
+def _idle_victim() -> Optional[VoiceSession]:
+    """
+    Least recently active session that is not live. Call under _sessions_lock.
+    
+    Walks from the head of the LRU order, so this is O(1) unless the
+    oldest sessions are live ones being skipped.
+    """
+    return next((s for s in sessions.values() if not _is_live(s)), None)
+
+def create_session(user_id: str = ANONYMOUS_USER) -> Optional[str]:
+    """Create a new session or return existing one for user (None if the limit is reached)."""
     with _sessions_lock:
+        if user_id != ANONYMOUS_USER:
+            existing = user_index.get(user_id)
+            if existing and existing in sessions:
+                _touch(sessions[existing])
+                logger.info("♻️  [SESSION RESUMED] %s - User: %s", existing[-6:], user_id)
+                return existing
+        
+        while len(sessions) >= MAX_SESSIONS:
+            victim = _idle_victim()
+            if victim is None:
+                logger.warning("🚫 [SESSION REFUSED] User: %s - all %d sessions are live", user_id, MAX_SESSIONS)
+                return None
+            _drop(victim.session_id)
+            logger.info("🧹 [EVICTED] %s - session limit %d reached", victim.session_id[-6:], MAX_SESSIONS)
         
-        session_id = str(uuid.uuid4())
+        session_id = uuid.uuid4().hex
         sessions[session_id] = VoiceSession(session_id, user_id)
-        logger.info(f"✨ [SESSION CREATED] {session_id[-6:]} - User: {user_id}")
+        _index_add(session_id)
+        if user_id != ANONYMOUS_USER:
+            user_index[user_id] = session_id
+        logger.info("✨ [SESSION CREATED] %s - User: %s", session_id[-6:], user_id)
         return session_id
 
 def get_session(session_id: str) -> Optional[VoiceSession]:
-    """Retrieve session and update last_active timestamp."""
+    """
+    Retrieve session and update last_active timestamp.
+    
+    Always reorders under the lock, so the LRU order stays exact. Every
+    caller runs on the event loop thread, so the lock is never contended.
+    """
     with _sessions_lock:
         session = sessions.get(session_id)
         if session:
-            session.last_active = datetime.datetime.now()
+            _touch(session)
         return session
 
-def remove_session(session_id: str):
-    """Remove session from active sessions."""
+def find_session(session_ref: str) -> Optional[VoiceSession]:
+    """
+    Look up a session by full id or 6-character short id.
+    
+    Args:
+        session_ref: Full session id or its last 6 characters
+        
+    Returns:
+        The matching session (most recently active on short-id collision), or None
+    """
+    with _sessions_lock:
+        session = sessions.get(session_ref)
+        if session:
+            return session
+        
+        bucket = short_index.get(session_ref)
+        if not bucket:
+            return None
+        
+        return max(
+            (sessions[sid] for sid in bucket),
+            key=lambda s: s.last_active_mono
+        )
+
+def remove_session(session_id: str) -> bool:
+    """Remove session from active sessions. Returns False if it did not exist."""
     with _sessions_lock:
-        if session_id in sessions:
-            session = sessions[session_id]
-            session.is_playing = False
-            
-            duration = (datetime.datetime.now() - session.created_at).total_seconds()
-            logger.info(
-                f"🗑️  [SESSION REMOVED] {session_id[-6:]} - "
-                f"Duration: {duration:.0f}s, Turns: {session.metrics['total_turns']}"
-            )
-            
-            del sessions[session_id]
+        session = sessions.pop(session_id, None)
+        if not session:
+            return False
+        
+        _index_remove(session_id)
+        _forget_user(session)
+        session.is_playing = False
+        session.connected = False
+        
+        logger.info(
+            "🗑️  [SESSION REMOVED] %s - Duration: %.0fs, Turns: %d",
+            session_id[-6:], time.monotonic() - session.created_at_mono, session.metrics["total_turns"]
+        )
+        return True
 
 def update_session_context(session_id: str, context: str, replace: bool = False) -> bool:
     """
@@ -128,20 +343,20 @@ def update_session_context(session_id: str, context: str, replace: bool = False)
         session = sessions.get(session_id)
         
         if not session:
-            logger.warning(f"⚠️  [SESSION NOT FOUND] {session_id[-6:]}")
+            logger.warning("⚠️  [SESSION NOT FOUND] %s", session_id[-6:])
             return False
         
         if replace:
             session.dynamic_context = context
-            logger.info(f"🔄 [CONTEXT REPLACED] {session_id[-6:]}: {context[:50]}...")
+            logger.info("🔄 [CONTEXT REPLACED] %s: %.50s...", session_id[-6:], context)
         else:
             if session.dynamic_context:
                 session.dynamic_context += "\n\n" + context
             else:
                 session.dynamic_context = context
-            logger.info(f"➕ [CONTEXT APPENDED] {session_id[-6:]}: {context[:50]}...")
+            logger.info("➕ [CONTEXT APPENDED] %s: %.50s...", session_id[-6:], context)
         
-        session.last_active = datetime.datetime.now()
+        _touch(session)
         
         return True
 
@@ -164,18 +379,46 @@ def add_to_history(session_id: str, role: str, content: str, metadata: Optional[
         if not session:
             return False
         
+        # Epoch float; rendered to ISO only when history is read
         message = {
             "role": role,
             "content": content,
-            "timestamp": datetime.datetime.now().isoformat(),
+            "ts": time.time(),
             "metadata": metadata or {}
         }
         
-        session.history.append(message)
-        session.last_active = datetime.datetime.now()
+        session.append_message(message)
+        _touch(session)
         
         return True
 
+def message_timestamp(message: Dict) -> str:
+    """ISO-format a history message's timestamp ("" if it has none)."""
+    ts = message.get("ts")
+    return datetime.datetime.fromtimestamp(ts).isoformat() if ts is not None else ""
+
+def iter_conversation(session_id: str, max_messages: Optional[int] = None) -> Iterator[Dict]:
+    """
+    Lazily iterate the most recent messages of a session, oldest first.
+    
+    Nothing is copied; consume it without awaiting in between, since the
+    underlying deque may not be appended to while it is being iterated.
+    
+    Args:
+        session_id: Session identifier
+        max_messages: Maximum number of recent messages to yield
+        
+    Returns:
+        Iterator over the stored message dicts
+    """
+    session = sessions.get(session_id)
+    if not session:
+        return iter(())
+    
+    history = session.history
+    start = max(0, len(history) - max_messages) if max_messages else 0
+    return islice(history, start, None)
+
 def get_conversation_history(session_id: str, max_messages: Optional[int] = None) -> List[Dict]:
     """
     Get conversation history for a session.
@@ -185,20 +428,13 @@ def get_conversation_history(session_id: str, max_messages: Optional[int] = None
         max_messages: Maximum number of recent messages to return
         
     Returns:
-        List of messages (most recent first)
+        List of messages, oldest first, with ISO timestamps
     """
     with _sessions_lock:
-        session = sessions.get(session_id)
-        
-        if not session:
-            return []
-        
-        history = session.history
-        
-        if max_messages:
-            return history[-max_messages:]
-        
-        return history
+        return [
+            {**msg, "timestamp": message_timestamp(msg)}
+            for msg in iter_conversation(session_id, max_messages)
+        ]
 
 def clear_history(session_id: str) -> bool:
     """
@@ -216,9 +452,13 @@ def clear_history(session_id: str) -> bool:
         if not session:
             return False
         
-        session.history = []
+        session.history.clear()
+        session.history_generation += 1
+        session.summary = ""
+        session.last_user_preview = ""
+        session.last_assistant_preview = ""
         session.metrics["total_turns"] = 0
-        logger.info(f"🗑️  [HISTORY CLEARED] {session_id[-6:]}")
+        logger.info("🗑️  [HISTORY CLEARED] %s", session_id[-6:])
         
         return True
 
@@ -239,8 +479,7 @@ def get_session_count() -> int:
     Returns:
         Number of active sessions
     """
-    with _sessions_lock:
-        return len(sessions)
+    return len(sessions)
 
 def cleanup_inactive_sessions(max_idle_seconds: int = 3600) -> int:
     """
@@ -252,24 +491,26 @@ def cleanup_inactive_sessions(max_idle_seconds: int = 3600) -> int:
     Returns:
         Number of sessions removed
     """
-    now = datetime.datetime.now()
+    now = time.monotonic()
     removed_count = 0
     
+    # Oldest first, stopping at the first session still within the idle
+    # limit. Live sessions are skipped however long they have been quiet:
+    # a user can hold an open socket without speaking.
     with _sessions_lock:
-        sessions_to_remove = []
-        
-        for session_id, session in sessions.items():
-            idle_time = (now - session.last_active).total_seconds()
-            
-            if idle_time > max_idle_seconds:
-                sessions_to_remove.append(session_id)
+        stale = []
+        for session in sessions.values():
+            if now - session.last_active_mono <= max_idle_seconds:
+                break
+            if not _is_live(session):
+                stale.append(session.session_id)
         
-        for session_id in sessions_to_remove:
-            sessions.pop(session_id)
+        for session_id in stale:
+            _drop(session_id)
             removed_count += 1
-            logger.info(f"🧹 [CLEANUP] Removed inactive session {session_id[-6:]}")
+            logger.info("🧹 [CLEANUP] Removed inactive session %s", session_id[-6:])
     
     if removed_count > 0:
-        logger.info(f"🧹 [CLEANUP] Removed {removed_count} inactive sessions")
+        logger.info("🧹 [CLEANUP] Removed %d inactive sessions", removed_count)
     
     return removed_count
\ No newline at end of file
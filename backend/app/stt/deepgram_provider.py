@@ -1,18 +1,48 @@
 
 import httpx
+import orjson
 import os
+import random
+import asyncio
+from typing import Optional
+
+# Attempts per transcription; only 5xx responses are retried
+STT_MAX_ATTEMPTS = 2
 
 class DeepgramSTT:
+    # One keep-alive pool shared by every instance
+    _shared_client: Optional[httpx.AsyncClient] = None
+
     def __init__(self):
         self.api_key = os.getenv("DEEPGRAM_API_KEY")
         if not self.api_key:
             raise RuntimeError("DEEPGRAM_API_KEY not set")
         
-        self.client = httpx.AsyncClient(
-            timeout=10.0, 
-            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+        if DeepgramSTT._shared_client is None:
+            DeepgramSTT._shared_client = httpx.AsyncClient(
+                # Re-dials failed connects; nothing has been sent at that point
+                # (a custom transport owns the pool, so the limits go here)
+                transport=httpx.AsyncHTTPTransport(
+                    retries=2,
+                    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60)
+                ),
+                timeout=10.0
+            )
+        self.client = DeepgramSTT._shared_client
+        self.url = (
+            "https://api.deepgram.com/v1/listen?"
+            "model=nova-2&language=en&smart_format=true&punctuate=true"
         )
-        self.url = "https://api.deepgram.com/v1/listen"
+        self.headers = {
+            "Authorization": f"Token {self.api_key}",
+            "Content-Type": "audio/wav"
+        }
+
+    @classmethod
+    async def close_shared_client(cls):
+        if cls._shared_client is not None:
+            await cls._shared_client.aclose()
+            cls._shared_client = None
 
     async def transcribe(self, wav_bytes: bytes):
         """
@@ -20,29 +50,19 @@ class DeepgramSTT:
         returns: (transcript, language)
         """
         try:
-            url = "https://api.deepgram.com/v1/listen"
-            
-            headers = {
-                "Authorization": f"Token {self.api_key}",
-                "Content-Type": "audio/wav"
-            }
-            
-            params = {
-                "model": "nova-2",
-                "language": "en",
-                "smart_format": "true",
-                "punctuate": "true"
-            }
-
-            response = await self.client.post(
-                    self.url,
-                    headers=headers,
-                    params=params,
-                    content=wav_bytes
-                )
+            for attempt in range(STT_MAX_ATTEMPTS):
+                response = await self.client.post(
+                        self.url,
+                        headers=self.headers,
+                        content=wav_bytes
+                    )
+                if response.status_code < 500 or attempt == STT_MAX_ATTEMPTS - 1:
+                    break
+                # Transient upstream error: short jittered pause, then retry
+                await asyncio.sleep(random.uniform(0.025, 0.075))
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             alt = data["results"]["channels"][0]["alternatives"][0]
             transcript = alt.get("transcript", "")
             lang = data.get("metadata", {}).get("detected_language", "en")
@@ -1,16 +1,37 @@
-import json
+import orjson
 import os
 import asyncio
 import logging
+from collections import deque
 from websockets.client import connect
 
 logger = logging.getLogger(__name__)
 
+_IS_FINAL = '"is_final":true'
+_IS_FINAL_SPACED = '"is_final": true'
+
+# Audio is coalesced into frames of this many bytes before sending
+# (1920 bytes = 60 ms of 16 kHz PCM16); a partial frame is flushed after
+# STT_BATCH_MAX_DELAY seconds so the tail of an utterance is never held
+STT_BATCH_BYTES = int(os.getenv("STT_BATCH_BYTES", "1920"))
+STT_BATCH_MAX_DELAY = 0.06
+
+# Deepgram closes a stream that carries no data for ~10 s; while the caller
+# is holding audio back, a KeepAlive is sent after this many idle seconds
+STT_KEEPALIVE_INTERVAL = 5.0
+_MSG_KEEPALIVE = '{"type":"KeepAlive"}'
+
+# Pre-connected streams kept ready for new audio sessions
+STT_POOL_SIZE = int(os.getenv("STT_POOL_SIZE", "2"))
+
 class DeepgramStreamingSTT:
     def __init__(self, on_transcript):
         self.api_key = os.getenv("DEEPGRAM_API_KEY")
         self.on_transcript = on_transcript
         self.ws = None
+        self._buf = bytearray()
+        self._flush_handle = None
+        self._last_send = 0.0
 
         self.url = (
             "wss://api.deepgram.com/v1/listen?"
@@ -21,23 +42,74 @@ class DeepgramStreamingSTT:
     async def connect(self):
         headers = {"Authorization": f"Token {self.api_key}"}
         self.ws = await connect(self.url, extra_headers=headers)
+        self._last_send = asyncio.get_running_loop().time()
         asyncio.create_task(self._recv_loop())
         logger.info("✅ Deepgram STT connected")
 
+    @property
+    def is_open(self) -> bool:
+        return self.ws is not None and self.ws.open
+
     async def disconnect(self):
         if self.ws:
+            await self._flush()
             await self.ws.close()
             self.ws = None
             logger.info("🛑 Deepgram STT disconnected")
 
     async def send_audio(self, chunk: bytes):
-        if self.ws:
-            await self.ws.send(chunk)
+        if not self.ws:
+            return
+        self._buf += chunk
+        if len(self._buf) >= STT_BATCH_BYTES:
+            await self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                STT_BATCH_MAX_DELAY, self._flush_later
+            )
+
+    async def keep_alive(self):
+        """Keep the stream open while no audio is being sent."""
+        if not self.ws:
+            return
+        now = asyncio.get_running_loop().time()
+        if now - self._last_send >= STT_KEEPALIVE_INTERVAL:
+            self._last_send = now
+            await self.ws.send(_MSG_KEEPALIVE)
+
+    def _flush_later(self):
+        self._flush_handle = None
+        if self._buf:
+            asyncio.create_task(self._flush_quietly())
+
+    async def _flush_quietly(self):
+        # Timer-driven flushes have no caller to raise into
+        try:
+            await self._flush()
+        except Exception as e:
+            logger.error(f"STT Send Error: {e}")
+
+    async def _flush(self):
+        """Send whatever audio is buffered as a single frame."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._buf or not self.ws:
+            return
+        data = bytes(self._buf)
+        self._buf.clear()
+        self._last_send = asyncio.get_running_loop().time()
+        await self.ws.send(data)
 
     async def _recv_loop(self):
         try:
             async for message in self.ws:
-                data = json.loads(message)
+                # Only finals are acted on; skip interim and metadata frames
+                # with a substring test before paying for a JSON parse
+                if _IS_FINAL not in message and _IS_FINAL_SPACED not in message:
+                    continue
+
+                data = orjson.loads(message)
 
                 # Ignore non-transcript payloads
                 if "channel" not in data:
@@ -56,3 +128,87 @@ class DeepgramStreamingSTT:
 
         except Exception as e:
             logger.error(f"STT Stream Error: {e}")
+
+
+async def _no_transcript(_):
+    pass
+
+
+class STTPool:
+    """
+    Keeps up to `size` streaming connections open ahead of demand, so a new
+    audio session skips the TLS + WebSocket handshake to Deepgram.
+
+    Streams are leased once: on release they are closed rather than pooled
+    again, so no transcript from one user can reach the next. The pool is
+    refilled in the background after every lease.
+    """
+
+    def __init__(self, size: int = STT_POOL_SIZE):
+        self.size = size
+        self._idle: deque = deque()
+        self._filling = False
+        self._keepalive_task = None
+
+    async def fill(self):
+        """Connect streams until the pool is full. Errors propagate."""
+        if self._filling:
+            return
+        self._filling = True
+        try:
+            while len(self._idle) < self.size:
+                stt = DeepgramStreamingSTT(on_transcript=_no_transcript)
+                await stt.connect()
+                self._idle.append(stt)
+        finally:
+            self._filling = False
+        if self._keepalive_task is None:
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+
+    async def _fill_quietly(self):
+        try:
+            await self.fill()
+        except Exception as e:
+            logger.warning(f"STT pool refill failed: {e}")
+
+    async def acquire(self, on_transcript) -> DeepgramStreamingSTT:
+        """Lease a connected stream, dialing a new one if none are ready."""
+        stt = None
+        while self._idle:
+            candidate = self._idle.popleft()
+            if candidate.is_open:
+                stt = candidate
+                break
+        if self.size > 0:
+            asyncio.create_task(self._fill_quietly())
+        if stt is None:
+            stt = DeepgramStreamingSTT(on_transcript=on_transcript)
+            await stt.connect()
+        stt.on_transcript = on_transcript
+        return stt
+
+    async def release(self, stt: DeepgramStreamingSTT):
+        await stt.disconnect()
+
+    async def _keepalive_loop(self):
+        while True:
+            # Twice per interval, so no idle stream outlives Deepgram's timeout
+            await asyncio.sleep(STT_KEEPALIVE_INTERVAL / 2)
+            for stt in list(self._idle):
+                try:
+                    await stt.keep_alive()
+                except Exception as e:
+                    logger.warning(f"STT pool keepalive failed: {e}")
+
+    async def close(self):
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        while self._idle:
+            try:
+                await self._idle.popleft().disconnect()
+            except Exception as e:
+                logger.warning(f"STT pool close failed: {e}")
+
+
+stt_pool = STTPool()
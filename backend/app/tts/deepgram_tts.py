@@ -2,48 +2,87 @@
 
 import httpx
 import os
+import random
+import asyncio
 import logging
+from typing import AsyncIterator, Optional
 
 logger = logging.getLogger(__name__)
 
+# Attempts per sentence; only 5xx responses are retried, and only before
+# any audio has been forwarded
+TTS_MAX_ATTEMPTS = 2
+
 class DeepgramTTS:
+    # One keep-alive pool shared by every instance, so the startup warmup
+    # primes the connections each turn's synthesis reuses
+    _shared_client: Optional[httpx.AsyncClient] = None
+
     def __init__(self):
         self.api_key = os.getenv("DEEPGRAM_API_KEY")
         if not self.api_key:
             raise RuntimeError("DEEPGRAM_API_KEY not set")
-        self.client = httpx.AsyncClient(
-            timeout=10.0,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
-        )
+        if DeepgramTTS._shared_client is None:
+            DeepgramTTS._shared_client = httpx.AsyncClient(
+                # Re-dials failed connects; nothing has been sent at that point
+                # (a custom transport owns the pool, so the limits go here)
+                transport=httpx.AsyncHTTPTransport(
+                    retries=2,
+                    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60)
+                ),
+                timeout=10.0
+            )
+        self.client = DeepgramTTS._shared_client
         self.url = "https://api.deepgram.com/v1/speak?model=aura-asteria-en&encoding=linear16&sample_rate=16000"
+        self.headers = {
+            "Authorization": f"Token {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+    @classmethod
+    async def close_shared_client(cls):
+        if cls._shared_client is not None:
+            await cls._shared_client.aclose()
+            cls._shared_client = None
+        
+    async def generate_audio_stream(self, text: str) -> AsyncIterator[bytes]:
+        """
+        Stream audio from Deepgram TTS as it is synthesized.
+        Yields linear16 chunks cut on sample boundaries, so each one can be
+        played on its own. Errors propagate to the caller.
+        """
+        if not text.strip():
+            return
+        
+        for attempt in range(TTS_MAX_ATTEMPTS):
+            async with self.client.stream(
+                "POST",
+                self.url,
+                headers=self.headers,
+                json={"text": text}
+            ) as response:
+                if response.status_code < 500 or attempt == TTS_MAX_ATTEMPTS - 1:
+                    response.raise_for_status()
+                    carry = b""
+                    async for chunk in response.aiter_bytes():
+                        if carry:
+                            chunk = carry + chunk
+                        cut = len(chunk) & ~1
+                        carry = chunk[cut:]
+                        if cut:
+                            yield chunk[:cut]
+                    return
+            # Transient upstream error: short jittered pause, then retry
+            logger.warning("TTS %d from Deepgram, retrying", response.status_code)
+            await asyncio.sleep(random.uniform(0.025, 0.075))
         
     async def generate_audio(self, text: str) -> bytes:
         """
         Generate audio from text using Deepgram TTS
         Returns: Audio bytes (MP3 or WAV format)
         """
-        if not text.strip():
-            return b""
         try:
-            
-            headers = {
-                "Authorization": f"Token {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "text": text
-            }
-
-            response = await self.client.post(
-                self.url, 
-                headers=headers, 
-                json=payload
-            )
-            response.raise_for_status()
-            
-            return response.content
-            
+            return b"".join([chunk async for chunk in self.generate_audio_stream(text)])
         except Exception as e:
             logger.error(f"TTS Error: {e}")
-            return b""
\ No newline at end of file
+            return b""
@@ -11,22 +11,27 @@ Implements:
 import time
 import asyncio
 import logging
-from typing import Optional, Dict, Any
+from collections import deque
+from typing import Optional, Dict, Any, Awaitable, Callable
 from datetime import datetime
 from fastapi import WebSocket, WebSocketDisconnect
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import numpy as np
+import orjson
+import httpx
 
 from .sessions import (
+    VoiceSession,
     create_session, 
     remove_session, 
     get_session, 
     update_session_context,
-    add_to_history
+    add_to_history,
+    clear_history
 )
 from app.audio.vad import VoiceActivityDetector
 from app.audio.utterance import UtteranceCollector
-from app.stt.deepgram_stream import DeepgramStreamingSTT
+from app.stt.deepgram_stream import DeepgramStreamingSTT, stt_pool
 from app.llm.groq_provider import GroqLLM
 from app.tts.deepgram_tts import DeepgramTTS
 
@@ -40,14 +45,73 @@ except Exception as e:
     logger.error(f"Failed to initialize providers: {e}")
     raise
 
+# Audio buffered ahead of speech onset for STT, trimmed by duration so the
+# pre-roll does not depend on the client's frame size
+STT_PRE_SPEECH_SEC = 0.3
+STT_PRE_SPEECH_BYTES = int(16000 * STT_PRE_SPEECH_SEC) * 2  # 16-bit mono
+
+# Seconds of audio per 16 kHz sample
+FRAME_DUR_PER_SAMPLE = 1.0 / 16000.0
+
 # Track active tasks and sessions
 active_tasks: Dict[str, asyncio.Task] = {}
-active_sessions: Dict[str, Dict[str, Any]] = {}
+active_sessions: Dict[str, VoiceSession] = {}
+
+async def send_json_fast(websocket: WebSocket, payload: Any):
+    """send_json replacement: orjson encoding, sent as a text frame."""
+    await websocket.send_text(orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY).decode())
+
+# Message timestamps are re-formatted at most once per TIMESTAMP_RESOLUTION
+# seconds of loop time; every send in between reuses the cached string
+TIMESTAMP_RESOLUTION = 0.01
+_ts_cache = {"t": float("-inf"), "s": ""}
+
+def _now_iso() -> str:
+    """UTC ISO timestamp for outgoing messages, cached per TIMESTAMP_RESOLUTION."""
+    t = asyncio.get_running_loop().time()
+    if t - _ts_cache["t"] > TIMESTAMP_RESOLUTION:
+        _ts_cache["s"] = datetime.utcnow().isoformat()
+        _ts_cache["t"] = t
+    return _ts_cache["s"]
+
+def _static_prefix(**fields) -> str:
+    """Pre-encode a fixed message up to the opening quote of its timestamp."""
+    return orjson.dumps({**fields, "timestamp": ""}).decode()[:-2]
+
+# Fixed-schema messages: only the timestamp varies, so the JSON is built
+# once here and each send is a string concatenation
+_MSG_PING = orjson.dumps({"type": "ping"}).decode()
+_MSG_INTERRUPT = _static_prefix(type="interrupt")
+_MSG_INTERRUPT_ACK = _static_prefix(type="interrupt_ack")
+_MSG_PONG = _static_prefix(type="pong")
+_MSG_RESPONSE_COMPLETE = _static_prefix(type="agent_response_complete")
+_MSG_STATUS_IDLE = _static_prefix(type="status", status="idle")
+_MSG_STATUS_LISTENING = _static_prefix(type="status", status="listening")
+_MSG_STATUS_SPEAKING = _static_prefix(type="status", status="speaking")
+_MSG_STATUS_THINKING = _static_prefix(type="status", status="thinking")
+_MSG_STOP_AUDIO = _static_prefix(type="stop_audio", reason="barge_in")
+_MSG_TRANSCRIPTION_COMPLETE = _static_prefix(type="user_transcription_complete")
+
+def _stamped(prefix: str) -> str:
+    """Complete a message pre-encoded by _static_prefix with the current time."""
+    return prefix + _now_iso() + '"}'
+
+async def send_static(websocket: WebSocket, prefix: str):
+    """Send a message pre-encoded by _static_prefix, stamped with the current time."""
+    await websocket.send_text(_stamped(prefix))
+
+async def send_batch(websocket: WebSocket, *messages: str):
+    """
+    Send several encoded messages that would otherwise go out back to back
+    as one frame, a JSON array the client handles in order.
+    """
+    await websocket.send_text("[" + ",".join(messages) + "]")
+
 
 # ---------------------------------------------------------
 # METRICS DATA CLASS
 # ---------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class TurnMetrics:
     """Metrics for a single conversation turn"""
     vad_detection_ms: float
@@ -63,12 +127,191 @@ class TurnMetrics:
     user_text: str
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Flat fields, so a literal beats asdict's recursive deep copy
+        return {
+            "vad_detection_ms": self.vad_detection_ms,
+            "stt_latency_ms": self.stt_latency_ms,
+            "llm_latency_ms": self.llm_latency_ms,
+            "llm_ttft_ms": self.llm_ttft_ms,
+            "tts_latency_ms": self.tts_latency_ms,
+            "e2e_latency_ms": self.e2e_latency_ms,
+            "search_used": self.search_used,
+            "search_latency_ms": self.search_latency_ms,
+            "timestamp": self.timestamp,
+            "session_id": self.session_id,
+            "user_text": self.user_text,
+        }
 
 
 # ---------------------------------------------------------
 # CONTROL WEBSOCKET (Feature #5: Real-Time Context Updates)
 # ---------------------------------------------------------
+@dataclass(slots=True)
+class ControlState:
+    """Per-connection state for the control WebSocket"""
+    session_id: Optional[str] = None
+    uid: str = "unknown"
+
+
+# ============= SESSION INITIALIZATION =============
+async def _handle_init(websocket: WebSocket, data: Dict[str, Any], state: ControlState):
+    session_id = data.get("session_id")
+    user_id = data.get("user_id", "guest")
+    
+    if not session_id:
+        session_id = create_session(user_id=user_id)
+        if not session_id:
+            await send_json_fast(websocket, {
+                "type": "error",
+                "message": "Session limit reached"
+            })
+            return
+    
+    state.session_id = session_id
+    state.uid = session_id[-6:]
+    
+    await send_json_fast(websocket, {
+        "type": "ready",
+        "session_id": session_id,
+        "timestamp": _now_iso()
+    })
+    
+    logger.info(f"✅ [CONTROL INIT] {state.uid} - User: {user_id}")
+
+
+# ============= REAL-TIME CONTEXT UPDATE =============
+async def _handle_context_update(websocket: WebSocket, data: Dict[str, Any], state: ControlState):
+    session_id = state.session_id
+    if not session_id:
+        await send_json_fast(websocket, {
+            "type": "error",
+            "message": "Session not initialized"
+        })
+        return
+    
+    context = data.get("context", "")
+    replace = data.get("replace", False)  # Replace vs append
+    
+    try:
+        # Update session context - this affects the active voice session
+        success = update_session_context(
+            session_id, 
+            context, 
+            replace=replace
+        )
+        
+        if success:
+            # Cancel active task to apply new context immediately
+            if session_id in active_tasks:
+                task = active_tasks[session_id]
+                if not task.done():
+                    task.cancel()
+                    logger.info(f"⚡ [TASK CANCELLED] {state.uid} - Applying new context")
+            
+            await send_json_fast(websocket, {
+                "type": "context_updated",
+                "success": True,
+                "session_id": session_id,
+                "timestamp": _now_iso()
+            })
+            
+            logger.info(
+                f"📝 [CONTEXT UPDATE] {state.uid} - "
+                f"{'Replaced' if replace else 'Appended'}: {context[:50]}..."
+            )
+        else:
+            raise Exception("Session not found")
+            
+    except Exception as e:
+        await send_json_fast(websocket, {
+            "type": "error",
+            "message": f"Context update failed: {str(e)}"
+        })
+        logger.error(f"❌ [CONTEXT UPDATE FAILED] {state.uid}: {e}")
+
+
+# ============= GET ACTIVE METRICS =============
+async def _handle_get_metrics(websocket: WebSocket, data: Dict[str, Any], state: ControlState):
+    await send_json_fast(websocket, {
+        "type": "system_metrics",
+        "active_sessions": len(active_sessions),
+        "active_tasks": len(active_tasks),
+        "sessions": list(active_sessions.keys()),
+        "timestamp": _now_iso()
+    })
+
+
+# ============= GET SESSION STATUS =============
+async def _handle_get_session_status(websocket: WebSocket, data: Dict[str, Any], state: ControlState):
+    target_session = data.get("session_id", state.session_id)
+    if not target_session:
+        return
+    
+    sess = get_session(target_session)
+    if sess:
+        await send_json_fast(websocket, {
+            "type": "session_status",
+            "session_id": target_session,
+            "status": {
+                "user_id": sess.user_id,
+                "created_at": sess.created_at.isoformat(),
+                "metrics": sess.get_metrics(),
+                "active": target_session in active_sessions
+            },
+            "timestamp": _now_iso()
+        })
+    else:
+        await send_json_fast(websocket, {
+            "type": "error",
+            "message": "Session not found"
+        })
+
+
+# ============= CLEAR CONVERSATION HISTORY =============
+async def _handle_clear_history(websocket: WebSocket, data: Dict[str, Any], state: ControlState):
+    if not state.session_id:
+        return
+    
+    success = clear_history(state.session_id)
+    await send_json_fast(websocket, {
+        "type": "history_cleared",
+        "success": success
+    })
+    if success:
+        logger.info(f"🗑️  [HISTORY CLEARED] {state.uid}")
+
+
+# ============= HEALTH CHECK =============
+async def _handle_ping(websocket: WebSocket, data: Dict[str, Any], state: ControlState):
+    await send_static(websocket, _MSG_PONG)
+
+
+# Seconds between keepalive pings on an idle control socket
+CONTROL_PING_INTERVAL = 300
+
+
+async def _control_keepalive(websocket: WebSocket):
+    """Ping the control socket periodically to keep the connection alive."""
+    try:
+        while True:
+            await asyncio.sleep(CONTROL_PING_INTERVAL)
+            await websocket.send_text(_MSG_PING)
+    except Exception:
+        # Socket is gone; the receive loop handles the disconnect
+        pass
+
+
+# Control message type -> handler; one lookup instead of an if/elif chain
+_CONTROL_HANDLERS: Dict[str, Callable[[WebSocket, Dict[str, Any], ControlState], Awaitable[None]]] = {
+    "init": _handle_init,
+    "context_update": _handle_context_update,
+    "get_metrics": _handle_get_metrics,
+    "get_session_status": _handle_get_session_status,
+    "clear_history": _handle_clear_history,
+    "ping": _handle_ping,
+}
+
+
 async def websocket_handler(websocket: WebSocket):
     """
     Control websocket for real-time context updates and session management.
@@ -80,161 +323,38 @@ async def websocket_handler(websocket: WebSocket):
     - Dynamic context injection during conversation
     """
     await websocket.accept()
-    session_id: Optional[str] = None
-    uid = "unknown"
+    state = ControlState()
+    
+    # One long-lived ping task rather than a timeout around every receive
+    keepalive = asyncio.create_task(_control_keepalive(websocket))
     
     logger.info(f"🎛️  [CONTROL WS CONNECTED]")
     
     try:
         while True:
-            try:
-                data = await asyncio.wait_for(
-                    websocket.receive_json(), 
-                    timeout=300  # 5 min timeout
-                )
-            except asyncio.TimeoutError:
-                # Send ping to keep connection alive
-                await websocket.send_json({"type": "ping"})
-                continue
+            data = orjson.loads(await websocket.receive_text())
             
             msg_type = data.get("type")
+            handler = _CONTROL_HANDLERS.get(msg_type)
             
-            # ============= SESSION INITIALIZATION =============
-            if msg_type == "init":
-                session_id = data.get("session_id")
-                user_id = data.get("user_id", "guest")
-                
-                if not session_id:
-                    session_id = create_session(user_id=user_id)
-                
-                uid = session_id[-6:]
-                
-                await websocket.send_json({
-                    "type": "ready",
-                    "session_id": session_id,
-                    "timestamp": datetime.utcnow().isoformat()
-                })
-                
-                logger.info(f"✅ [CONTROL INIT] {uid} - User: {user_id}")
-            
-            # ============= REAL-TIME CONTEXT UPDATE =============
-            elif msg_type == "context_update":
-                if not session_id:
-                    await websocket.send_json({
-                        "type": "error",
-                        "message": "Session not initialized"
-                    })
-                    continue
-                
-                context = data.get("context", "")
-                replace = data.get("replace", False)  # Replace vs append
-                
-                try:
-                    # Update session context - this affects the active voice session
-                    success = update_session_context(
-                        session_id, 
-                        context, 
-                        replace=replace
-                    )
-                    
-                    if success:
-                        # Cancel active task to apply new context immediately
-                        if session_id in active_tasks:
-                            task = active_tasks[session_id]
-                            if not task.done():
-                                task.cancel()
-                                logger.info(f"⚡ [TASK CANCELLED] {uid} - Applying new context")
-                        
-                        await websocket.send_json({
-                            "type": "context_updated",
-                            "success": True,
-                            "session_id": session_id,
-                            "timestamp": datetime.utcnow().isoformat()
-                        })
-                        
-                        logger.info(
-                            f"📝 [CONTEXT UPDATE] {uid} - "
-                            f"{'Replaced' if replace else 'Appended'}: {context[:50]}..."
-                        )
-                    else:
-                        raise Exception("Session not found")
-                        
-                except Exception as e:
-                    await websocket.send_json({
-                        "type": "error",
-                        "message": f"Context update failed: {str(e)}"
-                    })
-                    logger.error(f"❌ [CONTEXT UPDATE FAILED] {uid}: {e}")
-            
-            # ============= GET ACTIVE METRICS =============
-            elif msg_type == "get_metrics":
-                metrics = {
-                    "type": "system_metrics",
-                    "active_sessions": len(active_sessions),
-                    "active_tasks": len(active_tasks),
-                    "sessions": list(active_sessions.keys()),
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                
-                await websocket.send_json(metrics)
-            
-            # ============= GET SESSION STATUS =============
-            elif msg_type == "get_session_status":
-                target_session = data.get("session_id", session_id)
-                
-                if target_session:
-                    sess = get_session(target_session)
-                    if sess:
-                        await websocket.send_json({
-                            "type": "session_status",
-                            "session_id": target_session,
-                            "status": {
-                                "user_id": sess.user_id,
-                                "created_at": sess.created_at.isoformat(),
-                                "metrics": sess.get_metrics(),
-                                "active": target_session in active_sessions
-                            },
-                            "timestamp": datetime.utcnow().isoformat()
-                        })
-                    else:
-                        await websocket.send_json({
-                            "type": "error",
-                            "message": "Session not found"
-                        })
-            
-            # ============= CLEAR CONVERSATION HISTORY =============
-            elif msg_type == "clear_history":
-                if session_id:
-                    from .sessions import clear_history
-                    success = clear_history(session_id)
-                    await websocket.send_json({
-                        "type": "history_cleared",
-                        "success": success
-                    })
-                    if success:
-                        logger.info(f"🗑️  [HISTORY CLEARED] {uid}")
-            
-            # ============= HEALTH CHECK =============
-            elif msg_type == "ping":
-                await websocket.send_json({
-                    "type": "pong",
-                    "timestamp": datetime.utcnow().isoformat()
-                })
-            
-            else:
-                await websocket.send_json({
+            if handler is None:
+                await send_json_fast(websocket, {
                     "type": "error",
                     "message": f"Unknown message type: {msg_type}"
                 })
+                continue
+            
+            await handler(websocket, data, state)
     
     except WebSocketDisconnect:
-        logger.info(f"🔴 [CONTROL WS DISCONNECT] {uid}")
+        logger.info(f"🔴 [CONTROL WS DISCONNECT] {state.uid}")
     except Exception as e:
-        logger.error(f"❌ [CONTROL WS ERROR] {uid}: {e}", exc_info=True)
+        logger.error(f"❌ [CONTROL WS ERROR] {state.uid}: {e}", exc_info=True)
     finally:
         # Cleanup
-        if session_id and session_id in active_sessions:
-            del active_sessions[session_id]
+        keepalive.cancel()
+        if state.session_id and state.session_id in active_sessions:
+            del active_sessions[state.session_id]
 
 
 # ---------------------------------------------------------
@@ -260,17 +380,19 @@ async def audio_ws(websocket: WebSocket):
     """
     await websocket.accept()
     
-    # Initialize session
+    # Initialize session; the object is looked up once and reused for
+    # every turn and barge-in on this connection
     session_id = create_session(user_id="guest")
+    if not session_id:
+        # Every session is live; try again later
+        await websocket.close(code=1013)
+        return
+    session = get_session(session_id)
+    session.connected = True
     uid = session_id[-6:]
     
-    # Track session state
-    active_sessions[session_id] = {
-        "connected_at": datetime.utcnow().isoformat(),
-        "turns": 0,
-        "interruptions": 0,
-        "total_latency": 0
-    }
+    # Track live audio sessions
+    active_sessions[session_id] = session
     
     logger.info(f"🟢 [AUDIO WS CONNECTED] {uid}")
     
@@ -283,6 +405,11 @@ async def audio_ws(websocket: WebSocket):
     )
     collector = UtteranceCollector()
     
+    # Frames heard while idle, replayed to STT when speech starts so the
+    # onset of the first word is not clipped
+    pre_speech: deque = deque()
+    pre_speech_bytes = 0
+    
     # Agent state tracking
     agent_task: Optional[asyncio.Task] = None
     agent_speaking = False
@@ -296,9 +423,10 @@ async def audio_ws(websocket: WebSocket):
     BARGE_MIN_SPEECH = 0.5  # Reduced from 0.8 - more responsive (250ms)
     
     # Turn tracking
-    first_speech_ts: Optional[float] = None
-    last_final_ts: Optional[float] = None
-    vad_end_ts: Optional[float] = None
+    # perf_counter_ns() readings, handed to process_turn for latency metrics
+    first_speech_ns: Optional[int] = None
+    last_final_ns: Optional[int] = None
+    vad_end_ns: Optional[int] = None
     current_transcript = ""
     
     # Metrics tracking
@@ -306,43 +434,41 @@ async def audio_ws(websocket: WebSocket):
     
     async def on_transcript(text: str, is_final: bool = True):
         """Callback for STT transcription results"""
-        nonlocal current_transcript, last_final_ts
+        nonlocal current_transcript, last_final_ns
         
         if not text.strip():
             return
         
         if is_final:
             current_transcript = text
-            last_final_ts = time.perf_counter()
-            
-            # Send live captions to frontend (Feature #10)
-            await websocket.send_json({
-                "type": "user_transcription",
-                "transcription": text,
-                "is_final": True,
-                "timestamp": datetime.utcnow().isoformat()
-            })
+            last_final_ns = time.perf_counter_ns()
             
-            # Signal completion
-            await websocket.send_json({
-                "type": "user_transcription_complete",
-                "timestamp": datetime.utcnow().isoformat()
-            })
+            # Send live captions to frontend (Feature #10), batched with
+            # the completion signal
+            await send_batch(
+                websocket,
+                orjson.dumps({
+                    "type": "user_transcription",
+                    "transcription": text,
+                    "is_final": True,
+                    "timestamp": _now_iso()
+                }).decode(),
+                _stamped(_MSG_TRANSCRIPTION_COMPLETE)
+            )
         else:
             # Send partial transcripts for real-time feedback
-            await websocket.send_json({
+            await send_json_fast(websocket, {
                 "type": "user_transcription",
                 "transcription": text,
                 "is_final": False,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": _now_iso()
             })
     
-    # Initialize STT with streaming
+    # Lease a pre-connected STT stream
     stt: Optional[DeepgramStreamingSTT] = None
     
     try:
-        stt = DeepgramStreamingSTT(on_transcript=on_transcript)
-        await stt.connect()
+        stt = await stt_pool.acquire(on_transcript)
         
         # Main audio processing loop
         while True:
@@ -352,38 +478,44 @@ async def audio_ws(websocket: WebSocket):
             if msg.get("type") == "websocket.disconnect":
                 break
             
-            # Handle JSON control messages
-            if "text" in msg:
+            # Handle JSON control messages (parsed from this frame; a second
+            # receive here would consume the next audio frame)
+            text = msg.get("text")
+            if text is not None:
                 try:
-                    data = await websocket.receive_json()
+                    data = orjson.loads(text)
+                except orjson.JSONDecodeError:
+                    logger.warning("⚠️  [BAD CONTROL MESSAGE] %s", uid)
+                    continue
+                
+                # Handle client-side interrupt signal
+                if isinstance(data, dict) and data.get("type") == "interrupt":
+                    logger.info("⚡ [CLIENT INTERRUPT] %s", uid)
                     
-                    # Handle client-side interrupt signal
-                    if data.get("type") == "interrupt":
-                        logger.info(f"⚡ [CLIENT INTERRUPT] {uid}")
-                        
-                        # Cancel agent task
-                        if agent_task and not agent_task.done():
-                            agent_task.cancel()
-                            try:
-                                await agent_task
-                            except asyncio.CancelledError:
-                                pass
-                        
-                        # Reset state
-                        agent_task = None
-                        agent_speaking = False
-                        barge_start_ts = None
-                        ai_speech_start_ts = None
-                        
-                        # Acknowledge interrupt
-                        await websocket.send_json({
-                            "type": "interrupt_ack",
-                            "timestamp": datetime.utcnow().isoformat()
-                        })
-                        
-                        continue
-                except:
-                    pass
+                    # Cancel agent task (not awaited; it unwinds in the background)
+                    if agent_task and not agent_task.done():
+                        agent_task.cancel()
+                    
+                    # Reset state
+                    agent_task = None
+                    agent_speaking = False
+                    barge_start_ts = None
+                    ai_speech_start_ts = None
+                    
+                    # Acknowledge interrupt
+                    await send_static(websocket, _MSG_INTERRUPT_ACK)
+                
+                # Client's caption drifted from cum_len: resend it whole
+                elif isinstance(data, dict) and data.get("type") == "caption_resync":
+                    caption = session.live_caption
+                    await send_json_fast(websocket, {
+                        "type": "agent_caption",
+                        "text": caption,
+                        "cum_len": len(caption.encode("utf-16-le")) // 2,
+                        "timestamp": _now_iso()
+                    })
+                
+                continue
             
             # Process audio bytes
             if "bytes" not in msg:
@@ -391,40 +523,46 @@ async def audio_ws(websocket: WebSocket):
             
             pcm = msg["bytes"]
             
-            # Convert to numpy array for processing
-            samples = (
-                np.frombuffer(pcm, dtype=np.int16)
-                .astype(np.float32) / 32768.0
-            )
+            # Zero-copy int16 view; VAD normalizes as it reads
+            samples = np.frombuffer(pcm, dtype=np.int16)
             
             # Voice Activity Detection
             is_speech = vad.is_speech(samples)
             
             # Track first speech for latency metrics
-            if is_speech and first_speech_ts is None:
-                first_speech_ts = time.perf_counter()
+            if is_speech and first_speech_ns is None:
+                first_speech_ns = time.perf_counter_ns()
                 
                 # Send visual feedback to user
-                await websocket.send_json({
-                    "type": "status",
-                    "status": "listening",
-                    "timestamp": datetime.utcnow().isoformat()
-                })
+                await send_static(websocket, _MSG_STATUS_LISTENING)
             
             # Process utterance collection (handles turn detection)
             result = collector.process(
                 samples,
                 is_speech,
-                len(samples) / 16000.0
+                len(samples) * FRAME_DUR_PER_SAMPLE
             )
             
-            # Send audio to STT
-            await stt.send_audio(pcm)
+            # Send audio to STT only while an utterance is open; idle
+            # silence is held back (bar the pre-speech frames) and the
+            # stream is kept alive instead
+            if is_speech or collector.active:
+                for chunk in pre_speech:
+                    await stt.send_audio(chunk)
+                pre_speech.clear()
+                pre_speech_bytes = 0
+                await stt.send_audio(pcm)
+            else:
+                pre_speech.append(pcm)
+                pre_speech_bytes += len(pcm)
+                while pre_speech_bytes - len(pre_speech[0]) >= STT_PRE_SPEECH_BYTES:
+                    pre_speech_bytes -= len(pre_speech.popleft())
+                await stt.keep_alive()
             
             # ============= EARLY INTENT DETECTION =============
             # Don't process if collector indicates early detection
             if isinstance(result, str) and result == "EARLY":
-                logger.debug(f"⚡ [EARLY-INTENT] {uid}")
+                logger.debug("⚡ [EARLY-INTENT] %s", uid)
                 continue
             
             # ============= BARGE-IN DETECTION (IMPROVED) =============
@@ -440,33 +578,28 @@ async def audio_ws(websocket: WebSocket):
                     # Start barge-in timer
                     if barge_start_ts is None:
                         barge_start_ts = now
-                        logger.debug(f"🎤 [BARGE-IN DETECTION STARTED] {uid}")
+                        logger.debug("🎤 [BARGE-IN DETECTION STARTED] %s", uid)
                     
                     # Trigger barge-in after minimum speech duration
                     elif (now - barge_start_ts) >= BARGE_MIN_SPEECH:
-                        logger.info(f"⚡ [BARGE-IN TRIGGERED] {uid} - "
-                                  f"{(now - barge_start_ts):.2f}s of speech detected")
+                        logger.info("⚡ [BARGE-IN TRIGGERED] %s - %.2fs of speech detected",
+                                    uid, now - barge_start_ts)
                         
-                        # STEP 1: Send interrupt signal to frontend FIRST
-                        await websocket.send_json({
-                            "type": "interrupt",
-                            "timestamp": datetime.utcnow().isoformat()
-                        })
+                        # STEP 1: Send interrupt signal to frontend FIRST, with
+                        # the stop signal that clears any queued audio
+                        await send_batch(
+                            websocket,
+                            _stamped(_MSG_INTERRUPT),
+                            _stamped(_MSG_STOP_AUDIO)
+                        )
                         
-                        # STEP 2: Cancel current agent response task
+                        # STEP 2: Cancel current agent response task (not awaited,
+                        # so audio keeps flowing while it unwinds)
                         if agent_task and not agent_task.done():
                             agent_task.cancel()
-                            try:
-                                await agent_task
-                            except asyncio.CancelledError:
-                                pass
                         
                         # STEP 3: Update session metrics
-                        session = get_session(session_id)
-                        if session:
-                            session.metrics["interruptions"] += 1
-                        
-                        active_sessions[session_id]["interruptions"] += 1
+                        session.metrics["interruptions"] += 1
                         
                         # STEP 4: Reset agent state IMMEDIATELY
                         agent_task = None
@@ -474,17 +607,7 @@ async def audio_ws(websocket: WebSocket):
                         barge_start_ts = None
                         ai_speech_start_ts = None
                         
-                        # STEP 5: CRITICAL - Send stop signal to clear any queued audio
-                        await websocket.send_json({
-                            "type": "stop_audio",
-                            "reason": "barge_in",
-                            "timestamp": datetime.utcnow().isoformat()
-                        })
-                        
-                        logger.debug(f"🛑 [AUDIO STOP SIGNAL SENT] {uid}")
-                        
-                        # STEP 6: Brief pause to ensure clean state
-                        await asyncio.sleep(0.1)
+                        logger.debug("🛑 [AUDIO STOP SIGNAL SENT] %s", uid)
                 else:
                     # Reset barge-in timer if silence detected
                     barge_start_ts = None
@@ -492,37 +615,33 @@ async def audio_ws(websocket: WebSocket):
             # ============= TURN COMPLETION DETECTION =============
             if isinstance(result, np.ndarray):
                 # Record VAD end time for metrics
-                vad_end_ts = time.perf_counter()
+                vad_end_ns = time.perf_counter_ns()
                 
                 # Only process if we have valid transcript
                 if not current_transcript.strip():
-                    logger.debug(f"⚠️  [EMPTY TRANSCRIPT] {uid} - Skipping turn")
+                    logger.debug("⚠️  [EMPTY TRANSCRIPT] %s - Skipping turn", uid)
                     continue
                 
                 turn_count += 1
-                active_sessions[session_id]["turns"] = turn_count
                 
                 logger.info(
-                    f"🚀 [TURN #{turn_count}] {uid}: "
-                    f"\"{current_transcript[:60]}{'...' if len(current_transcript) > 60 else ''}\""
+                    '🚀 [TURN #%d] %s: "%.60s%s"',
+                    turn_count, uid, current_transcript,
+                    "..." if len(current_transcript) > 60 else ""
                 )
                 
                 # Send thinking status
-                await websocket.send_json({
-                    "type": "status",
-                    "status": "thinking",
-                    "timestamp": datetime.utcnow().isoformat()
-                })
+                await send_static(websocket, _MSG_STATUS_THINKING)
                 
                 # Create turn processing task
                 agent_task = asyncio.create_task(
                     process_turn(
                         websocket=websocket,
-                        session_id=session_id,
+                        session=session,
                         text=current_transcript,
-                        first_speech_ts=first_speech_ts,
-                        vad_end_ts=vad_end_ts,
-                        last_final_ts=last_final_ts,
+                        first_speech_ns=first_speech_ns,
+                        vad_end_ns=vad_end_ns,
+                        last_final_ns=last_final_ns,
                         turn_number=turn_count
                     )
                 )
@@ -536,8 +655,8 @@ async def audio_ws(websocket: WebSocket):
                 
                 # Reset turn state
                 current_transcript = ""
-                first_speech_ts = None
-                vad_end_ts = None
+                first_speech_ns = None
+                vad_end_ns = None
                 barge_start_ts = None
     
     except WebSocketDisconnect:
@@ -545,10 +664,10 @@ async def audio_ws(websocket: WebSocket):
     except Exception as e:
         logger.error(f"❌ [AUDIO WS ERROR] {uid}: {e}", exc_info=True)
         try:
-            await websocket.send_json({
+            await send_json_fast(websocket, {
                 "type": "error",
                 "message": "Internal server error occurred",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": _now_iso()
             })
         except:
             pass
@@ -556,7 +675,7 @@ async def audio_ws(websocket: WebSocket):
         # Cleanup
         try:
             if stt:
-                await stt.disconnect()
+                await stt_pool.release(stt)
         except Exception as e:
             logger.error(f"Error disconnecting STT: {e}")
         
@@ -579,13 +698,53 @@ async def audio_ws(websocket: WebSocket):
 # ---------------------------------------------------------
 # TURN PROCESSING (LLM + TTS Pipeline)
 # ---------------------------------------------------------
+# Sentences whose TTS may be requested ahead of the one being played
+TTS_LOOKAHEAD = 1
+
+
+async def _open_tts(sentence: str):
+    """Start synthesizing a sentence; returns (stream, first chunk, first chunk time)."""
+    stream = tts_provider.generate_audio_stream(sentence)
+    try:
+        audio = await anext(stream, None)
+    except BaseException:
+        await stream.aclose()
+        raise
+    return stream, audio, time.perf_counter_ns()
+
+
+async def _discard_tts(opening: asyncio.Task):
+    """Cancel an unplayed TTS request, closing its stream if already open."""
+    if not opening.done():
+        opening.cancel()
+    elif not opening.cancelled() and opening.exception() is None:
+        await opening.result()[0].aclose()
+
+
+async def _prefetch_sentences(sentences, queue: asyncio.Queue, slots: asyncio.Semaphore):
+    """
+    Queue (sentence, tts_start_ns, opening) for each non-empty LLM sentence,
+    opening its TTS stream straight away, then None once the LLM is done.
+    slots bounds how many TTS streams are open at once.
+    """
+    try:
+        async for sentence in sentences:
+            if not sentence or not sentence.strip():
+                continue
+            await slots.acquire()
+            tts_start_ns = time.perf_counter_ns()
+            queue.put_nowait((sentence, tts_start_ns, asyncio.create_task(_open_tts(sentence))))
+    finally:
+        queue.put_nowait(None)
+
+
 async def process_turn(
     websocket: WebSocket,
-    session_id: str,
+    session: VoiceSession,
     text: str,
-    first_speech_ts: Optional[float],
-    vad_end_ts: Optional[float],
-    last_final_ts: Optional[float],
+    first_speech_ns: Optional[int],
+    vad_end_ns: Optional[int],
+    last_final_ns: Optional[int],
     turn_number: int
 ):
     """
@@ -598,10 +757,12 @@ async def process_turn(
     - Real-time captions
     - Error handling with fallbacks
     """
+    session_id = session.session_id
     uid = session_id[-6:]
     
-    # Timing metrics
-    turn_start = time.perf_counter()
+    # Timing metrics: integer perf_counter_ns() readings, converted to ms
+    # only when a latency is computed. The turn start doubles as LLM start.
+    turn_start_ns = time.perf_counter_ns()
     vad_latency = 0
     stt_latency = 0
     llm_latency = 0
@@ -613,59 +774,93 @@ async def process_turn(
     # Track if this is first audio chunk (for TTFT)
     first_audio = True
     full_response = ""
+    caption_len = 0
+    session.live_caption = ""
+    
+    # End-of-turn messages, sent with the idle status as one frame
+    closing = []
+    
+    # Read-ahead of LLM sentences with their TTS already requested
+    prefetched: asyncio.Queue = asyncio.Queue()
+    producer: Optional[asyncio.Task] = None
     
     try:
         # ============= CALCULATE VAD LATENCY =============
-        if first_speech_ts and vad_end_ts:
-            vad_latency = (vad_end_ts - first_speech_ts) * 1000
+        if first_speech_ns is not None and vad_end_ns is not None:
+            vad_latency = (vad_end_ns - first_speech_ns) * 1e-6
         
         # ============= CALCULATE STT LATENCY =============
-        if first_speech_ts and last_final_ts:
-            stt_latency = (last_final_ts - first_speech_ts) * 1000
+        if first_speech_ns is not None and last_final_ns is not None:
+            stt_latency = (last_final_ns - first_speech_ns) * 1e-6
         
         # ============= LLM PROCESSING =============
-        llm_start = time.perf_counter()
-        
         # Send speaking status
-        await websocket.send_json({
-            "type": "status",
-            "status": "speaking",
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        await send_static(websocket, _MSG_STATUS_SPEAKING)
         
-        # Stream response from LLM (sentence by sentence)
-        async for sentence in llm_provider.get_response_stream(
-            text=text,
-            language="en",
-            session_id=session_id
-        ):
-            if not sentence or not sentence.strip():
-                continue
-            
-            full_response += sentence + " "
-            
-            # ============= TTS PROCESSING =============
-            tts_start = time.perf_counter()
+        # Stream response from LLM (sentence by sentence). Sentences are
+        # read ahead in the background and each one's TTS request is opened
+        # as soon as it arrives, so the next sentence is already being
+        # synthesized while the current one's audio is sent.
+        tts_slots = asyncio.Semaphore(TTS_LOOKAHEAD + 1)
+        producer = asyncio.create_task(_prefetch_sentences(
+            llm_provider.get_response_stream(
+                text=text,
+                language="en",
+                session_id=session_id
+            ),
+            prefetched,
+            tts_slots
+        ))
+        
+        while True:
+            item = await prefetched.get()
+            if item is None:
+                # Surfaces any LLM error raised in the background
+                await producer
+                break
             
+            sentence, tts_start_ns, opening = item
             try:
-                audio = await tts_provider.generate_audio(sentence)
-                tts_latency = (time.perf_counter() - tts_start) * 1000
-            except Exception as e:
-                logger.error(f"❌ [TTS ERROR] {uid}: {e}")
-                # Continue with next sentence on TTS error
-                continue
-            
-            # ============= FIRST CHUNK METRICS =============
-            if first_audio:
-                llm_ttft = (tts_start - llm_start) * 1000
-                llm_latency = llm_ttft  # For first token
+                full_response += sentence + " "
                 
-                # Calculate total E2E latency
-                e2e_latency = (time.perf_counter() - turn_start) * 1000
+                # ============= SEND LIVE CAPTIONS (partial) =============
+                # Sent before the TTS attempt so a sentence whose audio fails
+                # still reaches the caption. Only the new text is sent; the
+                # client appends it and checks cum_len (UTF-16 units, as JS
+                # counts them) against its own, asking for a resync on a gap.
+                delta = sentence.strip() if not caption_len else " " + sentence.strip()
+                caption_len += len(delta.encode("utf-16-le")) // 2
+                session.live_caption += delta
+                await send_json_fast(websocket, {
+                    "type": "partial_agent_response",
+                    "delta": delta,
+                    "cum_len": caption_len,
+                    "timestamp": _now_iso()
+                })
                 
-                # Update session metrics
-                session = get_session(session_id)
-                if session:
+                # ============= TTS PROCESSING =============
+                # Audio is forwarded as Deepgram streams it; TTS latency is
+                # measured from the request to the first chunk
+                try:
+                    audio_stream, audio, first_chunk_ns = await opening
+                    tts_latency = (first_chunk_ns - tts_start_ns) * 1e-6
+                except Exception as e:
+                    logger.error(f"❌ [TTS ERROR] {uid}: {e}")
+                    # Continue with next sentence on TTS error
+                    continue
+                
+                if audio is None:
+                    continue
+                
+                # ============= FIRST CHUNK METRICS =============
+                if first_audio:
+                    llm_ttft = (tts_start_ns - turn_start_ns) * 1e-6
+                    llm_latency = llm_ttft  # For first token
+                    
+                    # Calculate total E2E latency
+                    e2e_latency = (first_chunk_ns - turn_start_ns) * 1e-6
+                    
+                    # Update session metrics
                     session.update_metrics(
                         ttft=llm_ttft,
                         vad_latency=vad_latency,
@@ -674,64 +869,58 @@ async def process_turn(
                         tts_latency=tts_latency,
                         e2e_latency=e2e_latency
                     )
+                    
+                    # Send comprehensive metrics (Feature #8: Observability Dashboard)
+                    await send_json_fast(websocket, {
+                        "type": "pipeline_metrics",
+                        "metrics": {
+                            "vad": round(vad_latency, 0),
+                            "stt": round(stt_latency, 0),
+                            "llm": round(llm_latency, 0),
+                            "tts": round(tts_latency, 0),
+                            "e2e": round(e2e_latency, 0),
+                            "search": "AUTO"
+                        },
+                        "turn_number": turn_number
+                    })
+                    
+                    # Log metrics for observability
+                    logger.info(
+                        f"📊 [METRICS] {uid} Turn #{turn_number} - "
+                        f"VAD: {vad_latency:.0f}ms | "
+                        f"STT: {stt_latency:.0f}ms | "
+                        f"LLM: {llm_ttft:.0f}ms | "
+                        f"TTS: {tts_latency:.0f}ms | "
+                        f"E2E: {e2e_latency:.0f}ms"
+                    )
+                    
+                    first_audio = False
                 
-                # Send comprehensive metrics (Feature #8: Observability Dashboard)
-                await websocket.send_json({
-                    "type": "pipeline_metrics",
-                    "metrics": {
-                        "vad": round(vad_latency, 0),
-                        "stt": round(stt_latency, 0),
-                        "llm": round(llm_latency, 0),
-                        "tts": round(tts_latency, 0),
-                        "e2e": round(e2e_latency, 0),
-                        "search": "AUTO"
-                    },
-                    "turn_number": turn_number
-                })
-                
-                # Update session aggregate metrics
-                if session_id in active_sessions:
-                    active_sessions[session_id]["total_latency"] += e2e_latency
-                
-                # Log metrics for observability
-                logger.info(
-                    f"📊 [METRICS] {uid} Turn #{turn_number} - "
-                    f"VAD: {vad_latency:.0f}ms | "
-                    f"STT: {stt_latency:.0f}ms | "
-                    f"LLM: {llm_ttft:.0f}ms | "
-                    f"TTS: {tts_latency:.0f}ms | "
-                    f"E2E: {e2e_latency:.0f}ms"
-                )
-                
-                first_audio = False
-            
-            # ============= STREAM AUDIO TO CLIENT =============
-            await websocket.send_bytes(audio)
-            
-            # ============= SEND LIVE CAPTIONS (partial) =============
-            await websocket.send_json({
-                "type": "partial_agent_response",
-                "ai_partial": full_response.strip(),
-                "timestamp": datetime.utcnow().isoformat()
-            })
+                # ============= STREAM AUDIO TO CLIENT =============
+                try:
+                    await websocket.send_bytes(audio)
+                    async for audio in audio_stream:
+                        await websocket.send_bytes(audio)
+                except httpx.HTTPError as e:
+                    logger.error(f"❌ [TTS ERROR] {uid}: {e}")
+                finally:
+                    await audio_stream.aclose()
+            finally:
+                # Lets the producer open the next sentence's TTS
+                tts_slots.release()
         
         # ============= TURN COMPLETE =============
         # Add to history
         add_to_history(session_id, "user", text)
         add_to_history(session_id, "assistant", full_response.strip())
         
-        # Send agent response complete signal
-        await websocket.send_json({
-            "type": "agent_response_complete",
-            "timestamp": datetime.utcnow().isoformat()
-        })
-        
-        # Send completion signal
-        await websocket.send_json({
+        # Agent response complete and turn completion signals
+        closing.append(_stamped(_MSG_RESPONSE_COMPLETE))
+        closing.append(orjson.dumps({
             "type": "turn_complete",
             "turn_number": turn_number,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+            "timestamp": _now_iso()
+        }).decode())
         
         logger.info(f"✅ [TURN COMPLETE] {uid} Turn #{turn_number}")
     
@@ -741,43 +930,44 @@ async def process_turn(
         
         # Send partial response as final if we have any
         if full_response.strip():
-            await websocket.send_json({
-                "type": "agent_response_complete",
-                "timestamp": datetime.utcnow().isoformat()
-            })
+            closing.append(_stamped(_MSG_RESPONSE_COMPLETE))
         
-        await websocket.send_json({
+        closing.append(orjson.dumps({
             "type": "turn_cancelled",
             "reason": "barge_in",
             "turn_number": turn_number,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+            "timestamp": _now_iso()
+        }).decode())
         
         raise  # Re-raise to properly handle cancellation
     
     except Exception as e:
         logger.error(f"❌ [TURN ERROR] {uid} Turn #{turn_number}: {e}", exc_info=True)
         
-        try:
-            await websocket.send_json({
-                "type": "error",
-                "message": "Failed to process turn",
-                "turn_number": turn_number,
-                "timestamp": datetime.utcnow().isoformat()
-            })
-        except:
-            pass
+        closing.append(orjson.dumps({
+            "type": "error",
+            "message": "Failed to process turn",
+            "turn_number": turn_number,
+            "timestamp": _now_iso()
+        }).decode())
     
     finally:
-        # Cleanup task tracking
-        active_tasks.pop(session_id, None)
+        # Stop reading ahead and close any TTS streams opened for sentences
+        # that were never played
+        if producer is not None:
+            producer.cancel()
+        while not prefetched.empty():
+            item = prefetched.get_nowait()
+            if item is not None:
+                await _discard_tts(item[2])
+        
+        # Cleanup task tracking; a cancelled turn can finish unwinding after
+        # the next one has started, so only remove our own entry
+        if active_tasks.get(session_id) is asyncio.current_task():
+            del active_tasks[session_id]
         
-        # Reset status
+        # Reset status, flushing the end-of-turn messages in the same frame
         try:
-            await websocket.send_json({
-                "type": "status",
-                "status": "idle",
-                "timestamp": datetime.utcnow().isoformat()
-            })
+            await send_batch(websocket, *closing, _stamped(_MSG_STATUS_IDLE))
         except:
             pass
\ No newline at end of file
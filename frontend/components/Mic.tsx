@@ -31,6 +31,15 @@ export default function VoiceMic() {
     isComplete: boolean; // Track if message is finalized
   };
 
+  type ServerMessage = {
+    type: string;
+    metrics?: Record<string, number>;
+    delta?: string;
+    cum_len?: number;
+    text?: string;
+    transcription?: string;
+  };
+
   const [turns, setTurns] = useState<TranscriptTurn[]>([]);
   const [currentMetrics, setCurrentMetrics] = useState<PipelineMetrics | null>(null);
   const [logs, setLogs] = useState<string[]>([]);
@@ -47,6 +56,9 @@ export default function VoiceMic() {
   const bufferRef = useRef<Uint8Array | null>(null);
   const smoothRef = useRef(0);
   const maxRmsRef = useRef(0.02);
+  // Length of the current AI caption, checked against each delta's cum_len
+  const captionLenRef = useRef(0);
+  const captionResyncRef = useRef(false);
   const NOISE_FLOOR = 0.01;
 
   // Auto-scroll to bottom when turns change
@@ -138,127 +150,173 @@ export default function VoiceMic() {
         addLog("🔌 Disconnected from server");
       };
 
-      ws.onmessage = (event) => {
-        if (typeof event.data === "string") {
-          const msg = JSON.parse(event.data);
+      // Handles one server message; batched frames carry several
+      const handleMessage = (msg: ServerMessage) => {
+        if (msg.type === "interrupt" || msg.type === "stop_audio") {
+          addLog("⚡ Barge-in detected");
+          captionLenRef.current = 0;
+          captionResyncRef.current = false;
+          playerRef.current?.stop();
+          setAgentSpeaking(false);
+          return;
+        }
 
-          if (msg.type === "interrupt" || msg.type === "stop_audio") {
-            addLog("⚡ Barge-in detected");
-            playerRef.current?.stop();
-            setAgentSpeaking(false);
-            return;
-          }
+        if (msg.type === "pipeline_metrics" && msg.metrics) {
+          const m = msg.metrics;
+          const sanitizedMetrics = {
+            vad: Number(m.vad) || 0,
+            stt: Number(m.stt) || 0,
+            llm: Number(m.llm) || 0,
+            tts: Number(m.tts) || 0,
+            e2e: Number(m.e2e) || 0,
+          };
+          setCurrentMetrics(sanitizedMetrics);
+          addLatencyLog(
+            `VAD:${sanitizedMetrics.vad}ms | STT:${sanitizedMetrics.stt}ms | LLM:${sanitizedMetrics.llm}ms | TTS:${sanitizedMetrics.tts}ms | E2E:${sanitizedMetrics.e2e}ms`
+          );
+        }
 
-          if (msg.type === "pipeline_metrics" && msg.metrics) {
-            const m = msg.metrics;
-            const sanitizedMetrics = {
-              vad: Number(m.vad) || 0,
-              stt: Number(m.stt) || 0,
-              llm: Number(m.llm) || 0,
-              tts: Number(m.tts) || 0,
-              e2e: Number(m.e2e) || 0,
-            };
-            setCurrentMetrics(sanitizedMetrics);
-            addLatencyLog(
-              `VAD:${sanitizedMetrics.vad}ms | STT:${sanitizedMetrics.stt}ms | LLM:${sanitizedMetrics.llm}ms | TTS:${sanitizedMetrics.tts}ms | E2E:${sanitizedMetrics.e2e}ms`
-            );
+        // Handle AI partial responses (each carries only the new text)
+        if (msg.type === "partial_agent_response") {
+          addLog("🤖 AI responding...");
+          setAgentSpeaking(true);
+          
+          // A delta went missing: ask for the whole caption instead
+          const delta = msg.delta ?? "";
+          captionLenRef.current += delta.length;
+          if (captionResyncRef.current) return;
+          if (msg.cum_len !== undefined && msg.cum_len !== captionLenRef.current) {
+            captionResyncRef.current = true;
+            wsRef.current?.send(JSON.stringify({ type: "caption_resync" }));
+            return;
           }
-
-          // Handle AI partial responses
-          if (msg.type === "partial_agent_response") {
-            addLog("🤖 AI responding...");
-            setAgentSpeaking(true);
+          
+          setTurns((prev) => {
+            const last = prev[prev.length - 1];
             
-            setTurns((prev) => {
-              const last = prev[prev.length - 1];
-              
-              // If last message is AI and not complete, update it
-              if (last?.speaker === "ai" && !last.isComplete) {
-                const updated = [...prev];
-                updated[updated.length - 1] = { 
-                  ...last, 
-                  text: msg.ai_partial 
-                };
-                return updated;
+            // If last message is AI and not complete, update it
+            if (last?.speaker === "ai" && !last.isComplete) {
+              const updated = [...prev];
+              updated[updated.length - 1] = { 
+                ...last, 
+                text: last.text + delta 
+              };
+              return updated;
+            }
+            
+            // Otherwise create new AI message
+            return [
+              ...prev, 
+              { 
+                id: `ai-${Date.now()}-${Math.random()}`, 
+                text: delta.trimStart(), 
+                speaker: "ai",
+                isComplete: false
               }
-              
-              // Otherwise create new AI message
-              return [
-                ...prev, 
-                { 
-                  id: `ai-${Date.now()}-${Math.random()}`, 
-                  text: msg.ai_partial, 
-                  speaker: "ai",
-                  isComplete: false
-                }
-              ];
-            });
-          }
+            ];
+          });
+        }
 
-          // Handle complete AI response
-          if (msg.type === "agent_response_complete") {
-            addLog("✅ AI response complete");
-            setAgentSpeaking(false);
-            
-            setTurns((prev) => {
-              const last = prev[prev.length - 1];
-              if (last?.speaker === "ai") {
-                const updated = [...prev];
-                updated[updated.length - 1] = { 
-                  ...last, 
-                  isComplete: true 
-                };
-                return updated;
+        // Full caption resent after a resync request
+        if (msg.type === "agent_caption") {
+          const text = msg.text ?? "";
+          captionLenRef.current = msg.cum_len ?? text.length;
+          captionResyncRef.current = false;
+          
+          setTurns((prev) => {
+            const last = prev[prev.length - 1];
+            if (last?.speaker === "ai" && !last.isComplete) {
+              const updated = [...prev];
+              updated[updated.length - 1] = { ...last, text };
+              return updated;
+            }
+            return [
+              ...prev, 
+              { 
+                id: `ai-${Date.now()}-${Math.random()}`, 
+                text, 
+                speaker: "ai",
+                isComplete: false
               }
-              return prev;
-            });
-          }
+            ];
+          });
+        }
 
-          // Handle user captions/transcriptions
-          if (msg.type === "caption" || msg.type === "user_transcription") {
-            const userText = msg.text || msg.transcription || "";
-            addLog(`👤 User: ${userText.substring(0, 30)}...`);
+        // Handle complete AI response
+        if (msg.type === "agent_response_complete") {
+          addLog("✅ AI response complete");
+          setAgentSpeaking(false);
+          captionLenRef.current = 0;
+          captionResyncRef.current = false;
+          
+          setTurns((prev) => {
+            const last = prev[prev.length - 1];
+            if (last?.speaker === "ai") {
+              const updated = [...prev];
+              updated[updated.length - 1] = { 
+                ...last, 
+                isComplete: true 
+              };
+              return updated;
+            }
+            return prev;
+          });
+        }
+
+        // Handle user captions/transcriptions
+        if (msg.type === "caption" || msg.type === "user_transcription") {
+          const userText = msg.text || msg.transcription || "";
+          addLog(`👤 User: ${userText.substring(0, 30)}...`);
+          
+          setTurns((prev) => {
+            const last = prev[prev.length - 1];
+            
+            // If last message is user and not complete, update it
+            if (last?.speaker === "user" && !last.isComplete) {
+              const updated = [...prev];
+              updated[updated.length - 1] = { 
+                ...last, 
+                text: userText 
+              };
+              return updated;
+            }
             
-            setTurns((prev) => {
-              const last = prev[prev.length - 1];
-              
-              // If last message is user and not complete, update it
-              if (last?.speaker === "user" && !last.isComplete) {
-                const updated = [...prev];
-                updated[updated.length - 1] = { 
-                  ...last, 
-                  text: userText 
-                };
-                return updated;
+            // Otherwise create new user message
+            return [
+              ...prev, 
+              { 
+                id: `user-${Date.now()}-${Math.random()}`, 
+                text: userText, 
+                speaker: "user",
+                isComplete: false
               }
-              
-              // Otherwise create new user message
-              return [
-                ...prev, 
-                { 
-                  id: `user-${Date.now()}-${Math.random()}`, 
-                  text: userText, 
-                  speaker: "user",
-                  isComplete: false
-                }
-              ];
-            });
-          }
+            ];
+          });
+        }
 
-          // Handle user transcription complete
-          if (msg.type === "user_transcription_complete") {
-            setTurns((prev) => {
-              const last = prev[prev.length - 1];
-              if (last?.speaker === "user") {
-                const updated = [...prev];
-                updated[updated.length - 1] = { 
-                  ...last, 
-                  isComplete: true 
-                };
-                return updated;
-              }
-              return prev;
-            });
+        // Handle user transcription complete
+        if (msg.type === "user_transcription_complete") {
+          setTurns((prev) => {
+            const last = prev[prev.length - 1];
+            if (last?.speaker === "user") {
+              const updated = [...prev];
+              updated[updated.length - 1] = { 
+                ...last, 
+                isComplete: true 
+              };
+              return updated;
+            }
+            return prev;
+          });
+        }
+      };
+
+      ws.onmessage = (event) => {
+        if (typeof event.data === "string") {
+          const parsed = JSON.parse(event.data);
+          // Messages sent back to back arrive as one JSON array, in order
+          for (const msg of (Array.isArray(parsed) ? parsed : [parsed]) as ServerMessage[]) {
+            handleMessage(msg);
           }
         } else {
           setAgentSpeaking(true);